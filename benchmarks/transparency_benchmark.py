@@ -0,0 +1,76 @@
+# Frame time versus disc count for every transparency mode.
+# "discs" renders the disc actors only, so the table compares the transparency passes themselves;
+# "full" adds the two opaque strike/dip line actors of every disc, as drawn by main.py.
+# Usage: python benchmarks/transparency_benchmark.py [csv_output]
+import sys
+import os
+import csv
+import time
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pandas as pd
+from src.vtk_objects import create_points, create_disc_line_actors
+from src.visualization import create_renderer, create_render_window, configure_transparency, TRANSPARENCY_MODES
+from src.render_stats import record_orbit
+from src.interaction import split_disc_line_actors
+
+DISC_COUNTS = (100, 500, 2000)
+N_MARKERS = 8
+N_FRAMES = 60
+SCENES = ("discs", "full")
+
+def random_well_data(n_discs, seed=0):
+    """ Random picks spread in a 10 km box, similar to the Observations.csv layout """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "X": rng.uniform(0, 10000, n_discs),
+        "Y": rng.uniform(0, 10000, n_discs),
+        "Z": rng.uniform(-4000, 0, n_discs),
+        "MarkerName": rng.integers(0, N_MARKERS, n_discs).astype(str),
+        "Azimuth": rng.uniform(0, 360, n_discs),
+        "Dip": rng.uniform(0, 80, n_discs),
+    })
+
+def benchmark(mode, n_discs, scene="discs"):
+    """ Return (mean, p95) frame time in ms of an orbit around n_discs discs """
+    polydata, unique_markers = create_points(random_well_data(n_discs))
+    disc_actors, line_actors = split_disc_line_actors(
+        create_disc_line_actors(polydata, unique_markers, transparency=mode))
+    renderer = create_renderer()
+    for actor in disc_actors + (line_actors if scene == "full" else []):
+        renderer.AddActor(actor)
+    render_window = create_render_window(renderer)
+    render_window.SetOffScreenRendering(1)
+    configure_transparency(renderer, render_window, mode)
+    renderer.ResetCamera()
+    render_window.Render()  # warm up: shader compilation and buffer upload
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = record_orbit(render_window, renderer, os.path.join(tmp, "orbit.csv"),
+                            n_frames=N_FRAMES, step=360.0 / N_FRAMES)
+    frame_times = np.array([row["wall_time_s"] for row in rows]) * 1000
+    render_window.Finalize()
+    return frame_times.mean(), np.percentile(frame_times, 95)
+
+def main():
+    results = []
+    print(f"{'scene':<8}{'mode':<15}{'discs':>8}{'mean ms':>10}{'p95 ms':>10}")
+    for scene in SCENES:
+        for n_discs in DISC_COUNTS:
+            for mode in TRANSPARENCY_MODES:
+                start = time.perf_counter()
+                mean, p95 = benchmark(mode, n_discs, scene)
+                results.append({"scene": scene, "mode": mode, "discs": n_discs, "mean_ms": mean, "p95_ms": p95,
+                                "total_s": time.perf_counter() - start})
+                print(f"{scene:<8}{mode:<15}{n_discs:>8}{mean:>10.2f}{p95:>10.2f}")
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+
+if __name__ == "__main__":
+    main()
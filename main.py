@@ -1,25 +1,57 @@
+import argparse
 import src.well_data as data
 import src.vtk_objects as vtk_objects
 import src.visualization as visualization
 import src.actors as actors
 import src.edges as edges_mod
+import src.render_stats as render_stats
+import src.interaction as interaction
+import src.clustering as clustering
 
+# Picks of the same marker closer than CLUSTER_DISTANCE with poles within CLUSTER_ANGLE degrees
+# are drawn as a single disc. Set CLUSTER_DISTANCE to 0 to draw every pick.
+CLUSTER_DISTANCE = 200.0
+CLUSTER_ANGLE = 10.0
 
-def main():
+# One of visualization.TRANSPARENCY_MODES, see benchmarks/transparency_benchmark.py to pick one
+TRANSPARENCY = "oit"
+
+# None gives every segment its own two points and keeps the potentials as read. Set to one of
+# edges.WELD_RULES to share coincident vertices: "cell" keeps one potential per segment,
+# "mean"/"max"/"min" combine the potentials meeting at a vertex.
+EDGE_WELD = None
+
+
+def build_scene(serve=False):
+    """ Load the data and build every actor once.
+        In server mode the edges are not asked for on the console but chosen by clients' selection events.
+    """
     # Load data
     well_data = data.load_well_data()
     well_trajectories = data.load_well_trajectories()
+    if CLUSTER_DISTANCE > 0:
+        n_picks = len(well_data)
+        well_data = clustering.cluster_observations(well_data, CLUSTER_DISTANCE, CLUSTER_ANGLE)
+        print(f"Clustered {n_picks} picks into {len(well_data)} discs")
     scalar_bar, lut = visualization.create_potential_legend()
 
-    edges_actors = edges_mod.select_edges(
-        wd= data,  
-        connect_edges_with_potential=edges_mod.connect_edges_with_potential,
-        lut = lut
-    )
+    playback = {}
+    if serve:
+        edges_actors = [edges_mod.create_edge_actor(edges_mod.build_edges_polydata(
+            data.edges, [], edges_mod.connect_edges_with_potential), lut)]
+    else:
+        edges_actors = edges_mod.select_edges(
+            wd= data,  
+            connect_edges_with_potential=edges_mod.connect_edges_with_potential,
+            lut = lut,
+            playback = playback,
+            weld = EDGE_WELD
+        )
     
     # Create geometry
     polydata, unique_markers = vtk_objects.create_points(well_data)
-    point_actors = vtk_objects.create_disc_line_actors(polydata, unique_markers)
+    marker_actors = vtk_objects.create_disc_line_actors_by_marker(polydata, unique_markers, transparency=TRANSPARENCY)
+    point_actors = [actor for actors_ in marker_actors.values() for actor in actors_]
     line_actors = actors.create_well_line_actors(well_trajectories)
     
     # Calculate center of wind rose
@@ -48,8 +80,57 @@ def main():
     renderer.AddViewProp(scalar_bar)
     
     render_window = visualization.create_render_window(renderer)
+    visualization.configure_transparency(renderer, render_window, TRANSPARENCY)
+
+    return {
+        "renderer": renderer,
+        "render_window": render_window,
+        "marker_actors": marker_actors,
+        "point_actors": point_actors,
+        "line_actors": line_actors,
+        "edges_actors": edges_actors,
+        "edges_actor": edges_actors[0] if edges_actors else None,
+        "edges_list": data.edges,
+        "wind_rose_actors": wind_rose_actors,
+        "playback": playback,
+        "weld": EDGE_WELD,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Well visualization")
+    parser.add_argument("--serve", action="store_true",
+                        help="render offscreen and stream frames to remote clients instead of opening a window")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    scene = build_scene(serve=args.serve)
+    if args.serve:
+        # Only the server needs the HTTP stack, keep it out of the normal startup
+        import src.render_server as render_server
+        render_server.serve(scene, args.host, args.port)
+        return
+
+    renderer, render_window = scene["renderer"], scene["render_window"]
     interactor = visualization.create_interactor(render_window)
 
+    # Press 'i' to toggle the render statistics overlay, 'o' to log a camera orbit to CSV
+    render_stats.attach_stats_overlay(interactor, renderer)
+
+    # Draw a lightweight scene while the camera moves
+    disc_actors, strike_dip_actors = interaction.split_disc_line_actors(scene["point_actors"])
+    interaction.enable_interactive_detail(
+        interactor,
+        disc_actors=disc_actors,
+        hidden_actors=strike_dip_actors + interaction.select_labels(scene["line_actors"] + scene["wind_rose_actors"]),
+        edge_actors=scene["edges_actors"]
+    )
+
+    # Time series of edge potentials: slider, Left/Right and space
+    if scene["playback"]:
+        # Keep a reference, otherwise the slider widget is garbage collected
+        playback_widget = edges_mod.attach_playback_controls(interactor, **scene["playback"])
+
     # Render
     render_window.Render()
     interactor.Start()
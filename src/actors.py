@@ -1,14 +1,14 @@
 import src.vtk_objects as vtk_objects
-import vtk
+from vtkmodules.vtkRenderingCore import vtkActor, vtkBillboardTextActor3D, vtkPolyDataMapper
 
 ##################################################################
 # -----------------------DISC ACTOR----------------------------- #
 ##################################################################
-def create_actor(polydata, color = None, line = False, line_width = 2.0):
-    mapper = vtk.vtkPolyDataMapper()
+def create_actor(polydata, color = None, line = False, line_width = 2.0, opacity = 0.9, outline = False):
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(polydata)
     mapper.ScalarVisibilityOff()
-    actor = vtk.vtkActor()
+    actor = vtkActor()
     actor.SetMapper(mapper)
     if color is not None:
         actor.GetProperty().SetColor(color[:3])
@@ -18,8 +18,13 @@ def create_actor(polydata, color = None, line = False, line_width = 2.0):
         actor.GetProperty().SetRepresentationToWireframe()
         actor.GetProperty().LightingOff()
     else:
-        actor.GetProperty().SetOpacity(0.9)
-        actor.GetProperty().EdgeVisibilityOff()
+        actor.GetProperty().SetOpacity(opacity)
+        if outline:
+            # Opaque discs stay readable when they overlap thanks to a dark outline
+            actor.GetProperty().EdgeVisibilityOn()
+            actor.GetProperty().SetEdgeColor(0.1, 0.1, 0.1)
+        else:
+            actor.GetProperty().EdgeVisibilityOff()
     return actor
 
 ##################################################################
@@ -28,10 +33,10 @@ def create_actor(polydata, color = None, line = False, line_width = 2.0):
 
 def create_line_actor(polydata):
     """ Build and return a vtkActor for a polyline structure"""
-    mapper = vtk.vtkPolyDataMapper()
+    mapper = vtkPolyDataMapper()
     mapper.SetInputData(polydata)
 
-    line_actor = vtk.vtkActor()
+    line_actor = vtkActor()
     line_actor.SetMapper(mapper)
     line_actor.GetProperty().SetColor(0.1, 0.1, 0.1)
     line_actor.GetProperty().SetLineWidth(1)
@@ -39,7 +44,7 @@ def create_line_actor(polydata):
 
 def create_well_label(well_name, top_row):
     """ Create a billboard label at the top of the well """
-    label = vtk.vtkBillboardTextActor3D()
+    label = vtkBillboardTextActor3D()
     label.SetInput(str(well_name))
     label.SetPosition(top_row["X"], top_row["Y"], top_row["Z"])
     label.GetTextProperty().SetColor(0.1, 0.1, 0.1)
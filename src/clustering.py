@@ -0,0 +1,137 @@
+import math
+import numpy as np
+import src.geometry as geometry
+
+##################################################################
+# ------------------------POLE VECTORS-------------------------- #
+##################################################################
+def compute_poles(azimuth, dip):
+    """ Return an (n, 3) array with the plane normal of every observation """
+    return np.array([geometry.compute_plane_normal(az % 360, d) for az, d in zip(azimuth, dip)],
+                    dtype=float).reshape(-1, 3)
+
+def poles_to_orientations(poles, fallback_azimuth):
+    """ Convert (n, 3) pole vectors (not necessarily unit) back into azimuth and dip arrays in degrees """
+    poles = np.asarray(poles, dtype=float).reshape(-1, 3)
+    norms = np.linalg.norm(poles, axis=1)
+    poles = poles / np.where(norms > 0, norms, 1.0)[:, None]
+    poles[poles[:, 2] < 0] *= -1
+    dip = np.degrees(np.arccos(np.clip(poles[:, 2], -1.0, 1.0)))
+    azimuth = np.degrees(np.arctan2(poles[:, 0], poles[:, 1])) % 360
+    # Horizontal plane: azimuth is undefined, keep the one of the first pick
+    horizontal = np.hypot(poles[:, 0], poles[:, 1]) < 1e-9
+    azimuth = np.where(horizontal, fallback_azimuth, azimuth)
+    return azimuth, dip
+
+def pole_to_orientation(pole, fallback_azimuth=0.0):
+    """ Convert a (not necessarily unit) pole vector back into (azimuth, dip) in degrees """
+    azimuth, dip = poles_to_orientations([pole], np.array([fallback_azimuth], dtype=float))
+    return float(azimuth[0]), float(dip[0])
+
+##################################################################
+# --------------------------CLUSTERING-------------------------- #
+##################################################################
+def _grid_key(point, cell_size):
+    return tuple(int(c) for c in np.floor(point / cell_size))
+
+def _neighbour_keys(key):
+    kx, ky, kz = key
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                yield (kx + dx, ky + dy, kz + dz)
+
+def cluster_marker_points(coords, poles, distance_tolerance, angle_tolerance):
+    """ Greedily cluster the picks of one marker.
+        A pick joins a cluster when it is closer than `distance_tolerance` to the cluster centroid
+        and its pole is within `angle_tolerance` degrees of the cluster mean pole.
+        A tolerance <= 0 leaves every pick in its own cluster.
+        Returns a list of lists of row indices.
+    """
+    if not distance_tolerance > 0:
+        return [[i] for i in range(len(coords))]
+    cos_tol = math.cos(math.radians(angle_tolerance))
+    clusters = []         # [sum_coords, sum_pole, count, members, grid key of the centroid]
+    grid = {}             # grid cell -> indices of the clusters whose centroid falls in it
+
+    # Picks are visited along depth so clusters grow down the well
+    for i in np.argsort(coords[:, 2], kind="stable"):
+        point, pole = coords[i], poles[i]
+        key = _grid_key(point, distance_tolerance)
+        best, best_dist = None, None
+        for neighbour in _neighbour_keys(key):
+            for c in grid.get(neighbour, ()):
+                sum_coords, sum_pole, count, _, _ = clusters[c]
+                dist = np.linalg.norm(sum_coords / count - point)
+                if dist > distance_tolerance:
+                    continue
+                mean_pole = sum_pole / np.linalg.norm(sum_pole)
+                if abs(np.dot(mean_pole, pole)) < cos_tol:
+                    continue
+                if best is None or dist < best_dist:
+                    best, best_dist = c, dist
+
+        if best is None:
+            grid.setdefault(key, []).append(len(clusters))
+            clusters.append([point.copy(), pole.copy(), 1, [i], key])
+        else:
+            cluster = clusters[best]
+            # Poles are axial: flip before summing so opposite normals do not cancel
+            cluster[1] += pole if np.dot(cluster[1], pole) >= 0 else -pole
+            cluster[0] += point
+            cluster[2] += 1
+            cluster[3].append(i)
+            # Keep the cluster in the cell of its centroid, otherwise picks near a drifted centroid miss it
+            centroid_key = _grid_key(cluster[0] / cluster[2], distance_tolerance)
+            if centroid_key != cluster[4]:
+                grid[cluster[4]].remove(best)
+                grid.setdefault(centroid_key, []).append(best)
+                cluster[4] = centroid_key
+    return [members for _, _, _, members, _ in clusters]
+
+def cluster_observations(well_data, distance_tolerance=200.0, angle_tolerance=10.0):
+    """ Replace groups of nearby picks with similar orientation by one representative pick.
+        Clustering is done per MarkerName. Each output row has the mean position, the orientation
+        of the mean pole and a 'Count' column with the number of picks it represents.
+        A `distance_tolerance` <= 0 returns the picks unchanged with a Count of 1.
+    """
+    if not distance_tolerance > 0:
+        return well_data.assign(Count=1)
+    firsts, coords_out, azimuth_out, dip_out, counts = [], [], [], [], []
+    for positions in well_data.groupby("MarkerName", sort=False).indices.values():
+        group = well_data.iloc[positions]
+        coords = group[["X", "Y", "Z"]].to_numpy(dtype=float)
+        azimuth = group["Azimuth"].to_numpy(dtype=float)
+        dip = group["Dip"].to_numpy(dtype=float)
+        poles = compute_poles(azimuth, dip)
+
+        members = cluster_marker_points(coords, poles, distance_tolerance, angle_tolerance)
+        first = np.array([m[0] for m in members])
+        labels = np.empty(len(coords), dtype=int)
+        for label, m in enumerate(members):
+            labels[m] = label
+
+        # Poles are axial: align every pole with the first pick of its cluster before averaging
+        signs = np.where(np.einsum("ij,ij->i", poles, poles[first][labels]) < 0, -1.0, 1.0)
+        sum_poles = np.zeros((len(members), 3))
+        np.add.at(sum_poles, labels, poles * signs[:, None])
+        count = np.bincount(labels, minlength=len(members))
+        mean_coords = np.column_stack([np.bincount(labels, weights=coords[:, k], minlength=len(members))
+                                       for k in range(3)]) / count[:, None]
+        cluster_azimuth, cluster_dip = poles_to_orientations(sum_poles, azimuth[first])
+
+        firsts.append(positions[first])
+        coords_out.append(mean_coords)
+        azimuth_out.append(cluster_azimuth)
+        dip_out.append(cluster_dip)
+        counts.append(count)
+
+    if not firsts:
+        return well_data.iloc[0:0].assign(Count=0)
+    # One row per cluster: the first pick's columns with the cluster position and orientation
+    clustered = well_data.iloc[np.concatenate(firsts)].reset_index(drop=True)
+    clustered[["X", "Y", "Z"]] = np.concatenate(coords_out)
+    clustered["Azimuth"] = np.concatenate(azimuth_out)
+    clustered["Dip"] = np.concatenate(dip_out)
+    clustered["Count"] = np.concatenate(counts).astype(int)
+    return clustered
@@ -1,11 +1,12 @@
-import vtk, random
+import random
+from vtkmodules.vtkCommonCore import vtkLookupTable
 
 ##################################################################
 # ---------------------------COLORS----------------------------- #
 ##################################################################
 def generate_distinct_colors(n_colors):
     """ Build a random color table for each marker """
-    table = vtk.vtkLookupTable()
+    table = vtkLookupTable()
     table.SetNumberOfTableValues(n_colors)
     table.Build()
     random.seed(0)
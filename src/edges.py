@@ -1,17 +1,27 @@
-import vtk
-from vtk.util import numpy_support #type: ignore
+import hashlib
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkLine, vtkPolyData
+from vtkmodules.vtkFiltersCore import vtkAppendPolyData
+from vtkmodules.vtkInteractionWidgets import vtkSliderRepresentation2D, vtkSliderWidget
+from vtkmodules.vtkRenderingCore import vtkActor, vtkPolyDataMapper
+import numpy as np
+from vtkmodules.util import numpy_support #type: ignore
 
 def select_points(df):
     coords = df[["X", "Y", "Z"]].to_numpy(dtype=float)
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.SetData(numpy_support.numpy_to_vtk(coords))
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
     polydata.SetPoints(points)
     return polydata
 
-def connect_edges_with_potential(df):
-    """ Creates a vtkPolyData with connected lines colored according to 'potential' """
-    append_filter = vtk.vtkAppendPolyData()
+def connect_edges_with_potential(df, weld=None, tolerance=1e-6):
+    """ Creates a vtkPolyData with connected lines colored according to 'potential'.
+        With `weld` set to one of WELD_RULES, segments share their coincident endpoints (see connect_welded_edges)
+    """
+    if weld is not None:
+        return connect_welded_edges(df, weld, tolerance)
+    append_filter = vtkAppendPolyData()
     added_any = False
 
     for seg_id, group in df.groupby("Seg_id"):
@@ -21,11 +31,11 @@ def connect_edges_with_potential(df):
         points_polydata = select_points(group)
         points = points_polydata.GetPoints()
 
-        line = vtk.vtkLine()
+        line = vtkLine()
         line.GetPointIds().SetId(0, 0)
         line.GetPointIds().SetId(1, 1)
 
-        lines = vtk.vtkCellArray()
+        lines = vtkCellArray()
         lines.InsertNextCell(line)
 
         potential_array = numpy_support.numpy_to_vtk(
@@ -33,7 +43,7 @@ def connect_edges_with_potential(df):
         )
         potential_array.SetName("potential")
 
-        line_polydata = vtk.vtkPolyData()
+        line_polydata = vtkPolyData()
         line_polydata.SetPoints(points)
         line_polydata.SetLines(lines)
         line_polydata.GetPointData().SetScalars(potential_array)
@@ -42,14 +52,144 @@ def connect_edges_with_potential(df):
         added_any = True
 
     if not added_any:
-        return vtk.vtkPolyData()
+        return vtkPolyData()
     else:
         append_filter.Update()
     return append_filter.GetOutput()
 
 
-def select_edges(wd, connect_edges_with_potential, lut):
-    """ Ask user which indices to visualize """
+##################################################################
+# ----------------------SHARED VERTICES------------------------- #
+##################################################################
+# How the potentials of segments meeting at a welded vertex are combined.
+# "cell" keeps one potential per segment (mean of its two endpoints) as cell data.
+WELD_RULES = ("mean", "max", "min", "cell")
+
+def segment_endpoints(df):
+    """ Return the two endpoints and their potentials of every segment drawn by connect_edges_with_potential,
+        as (2 * n_segments, 3) coordinates and (2 * n_segments,) potentials in Seg_id order
+    """
+    seg_ids = df["Seg_id"].to_numpy()
+    if len(seg_ids) == 0:
+        return np.empty((0, 3)), np.empty(0)
+    order = np.argsort(seg_ids, kind="stable")
+    sorted_ids = seg_ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    sizes = np.diff(np.r_[starts, len(sorted_ids)])
+    valid = (sizes >= 2) & (sorted_ids[starts] != 0)
+    rows = np.column_stack([order[starts[valid]], order[starts[valid] + 1]]).ravel()
+
+    coords = df[["X", "Y", "Z"]].to_numpy(dtype=float)[rows]
+    potentials = df["potential"].to_numpy(dtype=float)[rows]
+    return coords, potentials
+
+def weld_vertices(coords, tolerance=1e-6):
+    """ Merge coordinates that fall in the same `tolerance` grid cell.
+        Returns the unique points and, for every input coordinate, the index of its point
+    """
+    quantized = np.round(coords / tolerance).astype(np.int64)
+    # Sorting the three columns is much faster than np.unique(axis=0) on millions of rows
+    order = np.lexsort((quantized[:, 2], quantized[:, 1], quantized[:, 0]))
+    sorted_rows = quantized[order]
+    is_new = np.r_[True, np.any(sorted_rows[1:] != sorted_rows[:-1], axis=1)]
+
+    inverse = np.empty(len(coords), dtype=np.int64)
+    inverse[order] = np.cumsum(is_new) - 1
+    return coords[order[is_new]], inverse
+
+def merge_potentials(potentials, inverse, n_points, rule="mean"):
+    """ Combine the potentials of coincident endpoints following one of WELD_RULES """
+    if rule == "cell":
+        return potentials.reshape(-1, 2).mean(axis=1)
+    if rule == "mean":
+        return np.bincount(inverse, weights=potentials, minlength=n_points) / \
+            np.bincount(inverse, minlength=n_points)
+    if rule == "max":
+        merged = np.full(n_points, -np.inf)
+        np.maximum.at(merged, inverse, potentials)
+        return merged
+    if rule == "min":
+        merged = np.full(n_points, np.inf)
+        np.minimum.at(merged, inverse, potentials)
+        return merged
+    raise ValueError(f"Unknown weld rule '{rule}', expected one of {WELD_RULES}")
+
+def build_welded_polydata(points, inverse, scalars, rule="mean"):
+    """ Build indexed line connectivity over shared points; scalars go to cell data for the 'cell' rule """
+    vtk_points = vtkPoints()
+    vtk_points.SetData(numpy_support.numpy_to_vtk(points))
+
+    connectivity = numpy_support.numpy_to_vtkIdTypeArray(inverse.astype(np.int64), deep=True)
+    offsets = numpy_support.numpy_to_vtkIdTypeArray(np.arange(0, len(inverse) + 1, 2, dtype=np.int64), deep=True)
+    lines = vtkCellArray()
+    lines.SetData(offsets, connectivity)
+
+    potential_array = numpy_support.numpy_to_vtk(scalars)
+    potential_array.SetName("potential")
+
+    polydata = vtkPolyData()
+    polydata.SetPoints(vtk_points)
+    polydata.SetLines(lines)
+    if rule == "cell":
+        polydata.GetCellData().SetScalars(potential_array)
+    else:
+        polydata.GetPointData().SetScalars(potential_array)
+    return polydata
+
+def connect_welded_edges(df, rule="mean", tolerance=1e-6):
+    """ Same lines as connect_edges_with_potential, but segments share their coincident vertices.
+        Potentials meeting at a shared vertex are combined following `rule` (one of WELD_RULES).
+    """
+    if rule not in WELD_RULES:
+        raise ValueError(f"Unknown weld rule '{rule}', expected one of {WELD_RULES}")
+    coords, potentials = segment_endpoints(df)
+    if len(coords) == 0:
+        return vtkPolyData()
+    points, inverse = weld_vertices(coords, tolerance)
+    scalars = merge_potentials(potentials, inverse, len(points), rule)
+    return build_welded_polydata(points, inverse, scalars, rule)
+
+##################################################################
+# ------------------------EDGE ACTORS--------------------------- #
+##################################################################
+def create_edge_actor(polydata, lut):
+    """ Build the actor that colors edges by their 'potential' scalars """
+    mapper = vtkPolyDataMapper()
+    mapper.SetInputData(polydata)
+    mapper.SetLookupTable(lut)
+    mapper.SetColorModeToMapScalars()
+    mapper.SetScalarRange(0, 1)  
+    mapper.ScalarVisibilityOn()
+
+    actor = vtkActor()
+    actor.SetMapper(mapper)
+    actor.GetProperty().SetLineWidth(2)
+    return actor
+
+def build_edges_polydata(edges_list, indices, connect_edges_with_potential, weld=None):
+    """ Append the edges of the given files into one polydata (empty if there is nothing to draw) """
+    append_filter = vtkAppendPolyData()
+    has_data = False  
+    for idx in indices:
+        if weld is not None:
+            polydata = connect_edges_with_potential(edges_list[idx], weld=weld)
+        else:
+            polydata = connect_edges_with_potential(edges_list[idx])
+        if polydata.GetNumberOfPoints() > 0:  
+            append_filter.AddInputData(polydata)
+            has_data = True
+
+    if not has_data:
+        return vtkPolyData()
+    append_filter.Update()
+    return append_filter.GetOutput()
+
+def select_edges(wd, connect_edges_with_potential, lut, playback=None, weld=None):
+    """ Ask user which indices to visualize.
+        If `playback` is a dict and the selected files are time steps of the same network, the user
+        can play them back instead: `playback` is filled with the arguments of attach_playback_controls.
+        `weld` is forwarded to connect_edges_with_potential to share coincident vertices.
+    """
     edges_list = wd.edges  # lista de DataFrames
 
     print("Files avaliables in wd.edges:")
@@ -75,33 +215,139 @@ def select_edges(wd, connect_edges_with_potential, lut):
 
         print(f"Showing files: {valid_indices}")
 
-        append_filter = vtk.vtkAppendPolyData()
-        has_data = False  
-        for idx in valid_indices:
-            polydata = connect_edges_with_potential(edges_list[idx])
-            if polydata.GetNumberOfPoints() > 0:  
-                append_filter.AddInputData(polydata)
-                has_data = True
+        if playback is not None and len(valid_indices) > 1 and \
+                len(group_edges_by_topology(edges_list, valid_indices)) == 1:
+            answer = input("The selected files share the same network. Play them as a time series? (y/n): ")
+            if answer.strip().lower() in ("y", "yes"):
+                polydata, arrays = build_edge_playback(edges_list, valid_indices, connect_edges_with_potential,
+                                                       weld=weld)
+                playback.update(polydata=polydata, arrays=arrays)
+                print("Use Left/Right to step, space to play/pause.")
+                return [create_edge_actor(polydata, lut)]
 
-        if not has_data:
+        polydata = build_edges_polydata(edges_list, valid_indices, connect_edges_with_potential, weld)
+        if polydata.GetNumberOfPoints() == 0:
             print("No valid edges found in the selected files.")
             return []
-
-        append_filter.Update()
-
-        # Mapper and Actor
-        mapper = vtk.vtkPolyDataMapper()
-        mapper.SetInputData(append_filter.GetOutput())
-        mapper.SetLookupTable(lut)
-        mapper.SetColorModeToMapScalars()
-        mapper.SetScalarRange(0, 1)  
-        mapper.ScalarVisibilityOn()
-
-        actor = vtk.vtkActor()
-        actor.SetMapper(mapper)
-        actor.GetProperty().SetLineWidth(2)
-        return [actor]
+        return [create_edge_actor(polydata, lut)]
 
     except ValueError:
         print("Invalid input. You must enter numbers or 'none'.")
         return []
+
+
+##################################################################
+# -----------------------EDGE PLAYBACK-------------------------- #
+##################################################################
+def edge_topology_key(df):
+    """ Hash of the Seg_id and coordinates of an edge file; equal keys mean the same network """
+    topology = df[["Seg_id", "X", "Y", "Z"]].to_numpy(dtype=float)
+    return hashlib.sha1(np.ascontiguousarray(topology).tobytes()).hexdigest()
+
+def group_edges_by_topology(edges_list, indices):
+    """ Group the given edge file indices by network topology """
+    groups = {}
+    for idx in indices:
+        groups.setdefault(edge_topology_key(edges_list[idx]), []).append(idx)
+    return groups
+
+def ordered_potentials(df):
+    """ Return the 'potential' column in the point order produced by connect_edges_with_potential """
+    sizes = df.groupby("Seg_id")["Seg_id"].transform("size")
+    kept = df[(sizes >= 2) & (df["Seg_id"] != 0)]
+    return kept.sort_values("Seg_id", kind="stable")["potential"].to_numpy(dtype=np.float32)
+
+def build_edge_playback(edges_list, indices, connect_edges_with_potential, weld=None, tolerance=1e-6):
+    """ Build the geometry of the first time step once and preload the potential of every step.
+        Returns the polydata and one vtk array per step sharing memory with a (steps, values) buffer.
+        With `weld` set, the geometry is welded here once for every step and `connect_edges_with_potential`
+        is not used.
+    """
+    if weld is None:
+        polydata = connect_edges_with_potential(edges_list[indices[0]])
+        buffer = np.stack([ordered_potentials(edges_list[idx]) for idx in indices])
+    else:
+        # Same topology for every step: weld once and reuse the mapping for every potential
+        coords, _ = segment_endpoints(edges_list[indices[0]])
+        points, inverse = weld_vertices(coords, tolerance)
+        buffer = np.stack([merge_potentials(segment_endpoints(edges_list[idx])[1], inverse, len(points), weld)
+                           for idx in indices]).astype(np.float32)
+        polydata = build_welded_polydata(points, inverse, buffer[0], weld)
+
+    arrays = []
+    for step in range(len(indices)):
+        array = numpy_support.numpy_to_vtk(buffer[step])
+        array.SetName("potential")
+        arrays.append(array)
+    # numpy_to_vtk does not copy: every array references its row of the buffer
+    set_playback_step(polydata, arrays, 0)
+    return polydata, arrays
+
+def set_playback_step(polydata, arrays, step):
+    """ Show a time step by swapping the active scalars, the geometry is left untouched """
+    if polydata.GetCellData().GetScalars() is not None:
+        polydata.GetCellData().SetScalars(arrays[step])
+    else:
+        polydata.GetPointData().SetScalars(arrays[step])
+
+def create_playback_slider(interactor, n_steps):
+    """ Slider widget at the bottom of the window to choose the time step """
+    slider = vtkSliderRepresentation2D()
+    slider.SetMinimumValue(0)
+    slider.SetMaximumValue(n_steps - 1)
+    slider.SetValue(0)
+    slider.SetTitleText("Time step")
+    slider.GetTitleProperty().SetColor(0.1, 0.1, 0.1)
+    slider.GetLabelProperty().SetColor(0.1, 0.1, 0.1)
+    slider.SetLabelFormat("%.0f")
+    slider.GetPoint1Coordinate().SetCoordinateSystemToNormalizedDisplay()
+    slider.GetPoint1Coordinate().SetValue(0.1, 0.08)
+    slider.GetPoint2Coordinate().SetCoordinateSystemToNormalizedDisplay()
+    slider.GetPoint2Coordinate().SetValue(0.6, 0.08)
+
+    widget = vtkSliderWidget()
+    widget.SetInteractor(interactor)
+    widget.SetRepresentation(slider)
+    widget.SetAnimationModeToJump()
+    return widget
+
+def attach_playback_controls(interactor, polydata, arrays, interval_ms=100):
+    """ Step through the time steps with a slider, Left/Right keys and space to play/pause """
+    widget = create_playback_slider(interactor, len(arrays))
+    slider = widget.GetRepresentation()
+    state = {"step": 0, "timer": None}
+
+    def show(step):
+        state["step"] = step % len(arrays)
+        set_playback_step(polydata, arrays, state["step"])
+        slider.SetValue(state["step"])
+        interactor.GetRenderWindow().Render()
+
+    def on_slider(obj, event):
+        step = int(round(slider.GetValue()))
+        if step != state["step"]:
+            show(step)
+
+    def on_key_press(obj, event):
+        key = obj.GetKeySym()
+        if key == "Right":
+            show(state["step"] + 1)
+        elif key == "Left":
+            show(state["step"] - 1)
+        elif key == "space":
+            if state["timer"] is None:
+                state["timer"] = interactor.CreateRepeatingTimer(interval_ms)
+            else:
+                interactor.DestroyTimer(state["timer"])
+                state["timer"] = None
+
+    def on_timer(obj, event):
+        # Ignore timers created by other observers or by the interactor style
+        if state["timer"] is not None and obj.GetTimerEventId() == state["timer"]:
+            show(state["step"] + 1)
+
+    widget.AddObserver("InteractionEvent", on_slider)
+    interactor.AddObserver("KeyPressEvent", on_key_press)
+    interactor.AddObserver("TimerEvent", on_timer)
+    widget.On()
+    return widget
@@ -1,4 +1,8 @@
-import vtk, math
+import math
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkLine, vtkPolyData
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
 
 ##################################################################
 # -----------------------USEFUL FUNCTIONS----------------------- #
@@ -23,15 +27,15 @@ def cross(a, b):
 ##################################################################
 def build_line(p0, p1):
     """ Return a vtkPolyData representing a single line from p0 to p1 """
-    points = vtk.vtkPoints()
-    lines = vtk.vtkCellArray()
+    points = vtkPoints()
+    lines = vtkCellArray()
     id0 = points.InsertNextPoint(*p0)
     id1 = points.InsertNextPoint(*p1)
-    line = vtk.vtkLine()
+    line = vtkLine()
     line.GetPointIds().SetId(0, id0)
     line.GetPointIds().SetId(1, id1)
     lines.InsertNextCell(line)
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
     polydata.SetPoints(points)
     polydata.SetLines(lines)
     return polydata
@@ -51,7 +55,7 @@ def _transform_from_normals(n_from=(0,0,1), n_to=(0,0,1)):
     dp = max(-1.0, min(1.0, dp))
     angle_rad = math.acos(dp)
     angle_deg = math.degrees(angle_rad)
-    tf = vtk.vtkTransform()
+    tf = vtkTransform()
     # no rotation needed
     if abs(angle_deg) < 1e-8:
         return tf
@@ -71,7 +75,7 @@ def _transform_from_normals(n_from=(0,0,1), n_to=(0,0,1)):
 
 def apply_transform(polydata, transform):
     """ Apply a vtkTransform to a vtkPolyData and return the transformed polydata """
-    tf_filter = vtk.vtkTransformPolyDataFilter()
+    tf_filter = vtkTransformPolyDataFilter()
     tf_filter.SetTransform(transform)
     tf_filter.SetInputData(polydata)
     tf_filter.Update()
@@ -149,7 +153,7 @@ def orient_disc_with_manteo(polydata, azimuth, dip, radius=200):
 ##################################################################
 def translate(polydata, x, y, z):
     """ Returns a translated copy of the given polydata"""
-    T = vtk.vtkTransform()
+    T = vtkTransform()
     T.Translate(x, y, z)
     return apply_transform(polydata, T)
 
@@ -7,16 +7,18 @@ def read_points(polydata):
     marker = polydata.GetPointData().GetArray("Marker_fault")
     az = polydata.GetPointData().GetArray("Azimuth")
     dp = polydata.GetPointData().GetArray("Dip")
-    return marker, az, dp
+    count = polydata.GetPointData().GetArray("Count")  # only present for clustered observations
+    return marker, az, dp, count
 
 def group_points_by_marker(polydata, n_colors):
     """ Group the polydata points by marker_fault """
-    marker_array, azimuth_array, dip_array = read_points(polydata)
+    marker_array, azimuth_array, dip_array, count_array = read_points(polydata)
     marker_to_points = {i: [] for i in range(n_colors)}
     for i in range(polydata.GetNumberOfPoints()):
         m = int(marker_array.GetTuple1(i))
         x, y, z = polydata.GetPoint(i)
         azimuth = azimuth_array.GetValue(i)
         dip = dip_array.GetValue(i)
-        marker_to_points[m].append((x, y, z, azimuth, dip))
+        count = int(count_array.GetTuple1(i)) if count_array is not None else 1
+        marker_to_points[m].append((x, y, z, azimuth, dip, count))
     return marker_to_points
\ No newline at end of file
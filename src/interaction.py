@@ -0,0 +1,140 @@
+import numpy as np
+from vtkmodules.util import numpy_support #type: ignore
+from vtkmodules.vtkCommonCore import vtkIdList, vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
+from vtkmodules.vtkFiltersCore import vtkExtractCells
+from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
+from vtkmodules.vtkRenderingCore import VTK_WIREFRAME, vtkActor, vtkBillboardTextActor3D, vtkPolyDataMapper
+
+##################################################################
+# ----------------------ACTOR CLASSIFICATION-------------------- #
+##################################################################
+def split_disc_line_actors(point_actors):
+    """ Split the output of create_disc_line_actors into (disc_actors, strike_dip_actors) """
+    discs, lines = [], []
+    for actor in point_actors:
+        if actor.GetProperty().GetRepresentation() == VTK_WIREFRAME:
+            lines.append(actor)
+        else:
+            discs.append(actor)
+    return discs, lines
+
+def select_labels(actors):
+    """ Return the billboard labels contained in a list of actors """
+    return [actor for actor in actors if isinstance(actor, vtkBillboardTextActor3D)]
+
+##################################################################
+# ----------------------LIGHTWEIGHT GEOMETRY-------------------- #
+##################################################################
+def decimate_lines(polydata, ratio):
+    """ Pipeline keeping one line cell out of every `ratio` with its point and cell data
+        (e.g. 'potential' of edges welded with the "cell" rule) and dropping the points no longer used.
+        Returns the last filter; Update() only re-executes when the input changed.
+    """
+    cell_ids = vtkIdList()
+    for cell_id in range(0, polydata.GetNumberOfCells(), max(1, int(ratio))):
+        cell_ids.InsertNextId(cell_id)
+    extract = vtkExtractCells()
+    extract.SetInputData(polydata)
+    extract.SetCellList(cell_ids)
+    # vtkExtractCells outputs an unstructured grid, the mapper expects polydata
+    geometry = vtkGeometryFilter()
+    geometry.SetInputConnection(extract.GetOutputPort())
+    geometry.Update()
+    return geometry
+
+def disc_centers(polydata):
+    """ Polydata with one vertex at the centre of every polygon (disc) of `polydata` """
+    polys = polydata.GetPolys()
+    offsets = numpy_support.vtk_to_numpy(polys.GetOffsetsArray()).astype(np.int64)
+    connectivity = numpy_support.vtk_to_numpy(polys.GetConnectivityArray()).astype(np.int64)
+    coords = numpy_support.vtk_to_numpy(polydata.GetPoints().GetData()).astype(float)
+    sizes = np.diff(offsets)
+    centers = np.zeros((0, 3))
+    if len(sizes):
+        # The vertex mean of a regular polygon is its centre
+        centers = np.add.reduceat(coords[connectivity], offsets[:-1], axis=0) / sizes[:, None]
+
+    points = vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(centers, deep=True))
+    ids = np.arange(len(centers) + 1, dtype=np.int64)
+    vertices = vtkCellArray()
+    vertices.SetData(numpy_support.numpy_to_vtkIdTypeArray(ids, deep=True),
+                     numpy_support.numpy_to_vtkIdTypeArray(ids[:-1], deep=True))
+    centers_polydata = vtkPolyData()
+    centers_polydata.SetPoints(points)
+    centers_polydata.SetVerts(vertices)
+    return centers_polydata
+
+def create_center_actor(disc_actor, point_size=3.0):
+    """ Hidden actor drawing the centres of a disc actor as points of the same colour """
+    mapper = vtkPolyDataMapper()
+    mapper.SetInputData(disc_centers(disc_actor.GetMapper().GetInput()))
+    mapper.ScalarVisibilityOff()
+    actor = vtkActor()
+    actor.SetMapper(mapper)
+    actor.GetProperty().SetColor(disc_actor.GetProperty().GetColor())
+    actor.GetProperty().SetPointSize(point_size)
+    actor.GetProperty().LightingOff()
+    actor.VisibilityOff()
+    return actor
+
+##################################################################
+# ---------------------INTERACTION DETAIL----------------------- #
+##################################################################
+def enable_interactive_detail(interactor, disc_actors=(), hidden_actors=(), edge_actors=(),
+                              edge_ratio=10, point_size=3.0,
+                              desired_update_rate=15.0, still_update_rate=0.001):
+    """ Swap in a lightweight scene while the camera moves and restore full detail when it stops.
+        During interaction every disc actor is replaced by an actor drawing one point per disc centre,
+        `hidden_actors` (labels, strike/dip lines) are hidden and edge actors show one line out of
+        every `edge_ratio`. Only visibilities change, so the full actors keep their GPU buffers.
+    """
+    interactor.SetDesiredUpdateRate(desired_update_rate)
+    interactor.SetStillUpdateRate(still_update_rate)
+
+    # Disc centres are built once and added next to their disc actor, hidden until an interaction starts
+    center_actors = []
+    renderers = interactor.GetRenderWindow().GetRenderers()
+    for disc in disc_actors:
+        center = create_center_actor(disc, point_size)
+        renderers.InitTraversal()
+        for _ in range(renderers.GetNumberOfItems()):
+            renderer = renderers.GetNextItem()
+            if renderer.HasViewProp(disc):
+                renderer.AddActor(center)
+        center_actors.append((disc, center))
+
+    # Build the decimated edges up front, not on every interaction (the edge geometry itself never changes)
+    edge_inputs = []
+    for actor in edge_actors:
+        full = actor.GetMapper().GetInput()
+        edge_inputs.append((actor, full, decimate_lines(full, edge_ratio)))
+
+    saved_visibility = {}
+
+    def on_start(obj, event):
+        for disc, center in center_actors:
+            # Markers hidden by the user stay hidden
+            center.SetVisibility(disc.GetVisibility())
+        for actor in list(disc_actors) + list(hidden_actors):
+            saved_visibility[actor] = actor.GetVisibility()
+            actor.VisibilityOff()
+        for actor, _, light in edge_inputs:
+            # Re-runs only if the edges changed since the last interaction (e.g. a playback step)
+            light.Update()
+            actor.GetMapper().SetInputData(light.GetOutput())
+
+    def on_end(obj, event):
+        for _, center in center_actors:
+            center.VisibilityOff()
+        for actor, visible in saved_visibility.items():
+            actor.SetVisibility(visible)
+        saved_visibility.clear()
+        for actor, full, _ in edge_inputs:
+            actor.GetMapper().SetInputData(full)
+
+    # The interactor style renders with the still update rate right after EndInteractionEvent
+    style = interactor.GetInteractorStyle()
+    style.AddObserver("StartInteractionEvent", on_start)
+    style.AddObserver("EndInteractionEvent", on_end)
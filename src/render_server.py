@@ -0,0 +1,256 @@
+import json, time, threading
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from vtkmodules.util import numpy_support #type: ignore
+from vtkmodules.vtkIOImage import vtkJPEGWriter, vtkPNGWriter
+from vtkmodules.vtkRenderingCore import vtkWindowToImageFilter
+import src.edges as edges_mod
+
+# The scene is built once and served to every client. A scene is a dict with:
+#   renderer, render_window   offscreen window the frames are read from
+#   marker_actors             {marker name: [actors]} for marker visibility events (optional)
+#   edges_actor, edges_list   actor and edge DataFrames for edge selection events (optional)
+#   weld                      weld rule forwarded to edges.build_edges_polydata (optional)
+
+##################################################################
+# ---------------------------FRAMES----------------------------- #
+##################################################################
+def create_frame_grabber(render_window):
+    """ Return a function encoding the current content of the window to JPEG or PNG bytes """
+    window_to_image = vtkWindowToImageFilter()
+    window_to_image.SetInput(render_window)
+    window_to_image.ReadFrontBufferOff()
+    writers = {"jpeg": vtkJPEGWriter(), "png": vtkPNGWriter()}
+    for writer in writers.values():
+        writer.WriteToMemoryOn()
+        writer.SetInputConnection(window_to_image.GetOutputPort())
+
+    def grab(fmt="jpeg", quality=80):
+        writer = writers[fmt]
+        if fmt == "jpeg":
+            writer.SetQuality(quality)
+        # The filter caches its output: mark it modified so the new frame is read back
+        window_to_image.Modified()
+        # The PNG writer appends to its in-memory result instead of replacing it
+        if writer.GetResult() is not None:
+            writer.GetResult().Reset()
+        writer.Write()
+        return numpy_support.vtk_to_numpy(writer.GetResult()).tobytes()
+    return grab
+
+def get_camera(renderer):
+    """ Current camera as a JSON friendly dict """
+    camera = renderer.GetActiveCamera()
+    return {"position": list(camera.GetPosition()),
+            "focal_point": list(camera.GetFocalPoint()),
+            "view_up": list(camera.GetViewUp()),
+            "view_angle": camera.GetViewAngle(),
+            "parallel_scale": camera.GetParallelScale()}
+
+def apply_camera(renderer, camera_event):
+    """ Apply a camera event: absolute position/focal_point/view_up/view_angle/parallel_scale
+        and/or relative azimuth/elevation/zoom
+    """
+    camera = renderer.GetActiveCamera()
+    if "position" in camera_event:
+        camera.SetPosition(*camera_event["position"])
+    if "focal_point" in camera_event:
+        camera.SetFocalPoint(*camera_event["focal_point"])
+    if "view_up" in camera_event:
+        camera.SetViewUp(*camera_event["view_up"])
+    # Zoom changes the view angle (or parallel scale): both are part of a client's camera
+    if "view_angle" in camera_event:
+        camera.SetViewAngle(float(camera_event["view_angle"]))
+    if "parallel_scale" in camera_event:
+        camera.SetParallelScale(float(camera_event["parallel_scale"]))
+    if "azimuth" in camera_event:
+        camera.Azimuth(camera_event["azimuth"])
+    if "elevation" in camera_event:
+        camera.Elevation(camera_event["elevation"])
+        camera.OrthogonalizeViewUp()
+    if "zoom" in camera_event:
+        camera.Zoom(camera_event["zoom"])
+    renderer.ResetCameraClippingRange()
+
+def apply_selection(scene, selection):
+    """ Apply a selection event: {"markers": {name: visible}, "edges": [file indices]} """
+    for name, visible in selection.get("markers", {}).items():
+        for actor in scene.get("marker_actors", {}).get(name, []):
+            actor.SetVisibility(bool(visible))
+
+    if "edges" in selection and scene.get("edges_actor") is not None:
+        indices = [int(i) for i in selection["edges"] if 0 <= int(i) < len(scene["edges_list"])]
+        polydata = edges_mod.build_edges_polydata(scene["edges_list"], indices,
+                                                  edges_mod.connect_edges_with_potential, scene.get("weld"))
+        scene["edges_actor"].GetMapper().SetInputData(polydata)
+
+##################################################################
+# ---------------------------SERVER----------------------------- #
+##################################################################
+def summarize(values):
+    """ Mean and 95th percentile (ms) of a list of durations in seconds """
+    if not values:
+        return {"mean_ms": 0.0, "p95_ms": 0.0}
+    ordered = sorted(values)
+    return {"mean_ms": 1000 * sum(ordered) / len(ordered),
+            "p95_ms": 1000 * ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]}
+
+def create_render_server(scene, host="127.0.0.1", port=8765, history=500):
+    """ HTTP server streaming frames of `scene`. Endpoints:
+        GET  /frame?client=<id>&format=jpeg|png&quality=<1-100>   encoded frame seen by that client's camera
+        POST /camera?client=<id>     JSON camera event (see apply_camera), each client has its own camera
+        POST /selection              JSON selection event (see apply_selection), shared by all clients
+        GET  /stats                  render and encode latency of the last `history` frames
+    """
+    renderer, render_window = scene["renderer"], scene["render_window"]
+    render_window.SetOffScreenRendering(1)
+
+    # OpenGL contexts belong to one thread: every VTK call goes through this single worker
+    vtk_thread = ThreadPoolExecutor(max_workers=1)
+    grab = create_frame_grabber(render_window)
+    # The first render creates the context and resets the camera to the scene bounds
+    vtk_thread.submit(render_window.Render).result()
+    default_camera = vtk_thread.submit(get_camera, renderer).result()
+    cameras = {}
+    timings = {"render": deque(maxlen=history), "encode": deque(maxlen=history)}
+    lock = threading.Lock()
+
+    def render_frame(client, fmt, quality):
+        apply_camera(renderer, cameras.get(client, default_camera))
+        start = time.perf_counter()
+        render_window.Render()
+        rendered = time.perf_counter()
+        data = grab(fmt, quality)
+        encoded = time.perf_counter()
+        return data, rendered - start, encoded - rendered
+
+    def update_camera(client, camera_event):
+        apply_camera(renderer, cameras.get(client, default_camera))
+        apply_camera(renderer, camera_event)
+        cameras[client] = get_camera(renderer)
+        return cameras[client]
+
+    class RenderRequestHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def send_json(self, payload, status=200):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def read_json(self):
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/frame":
+                client = query.get("client", ["default"])[0]
+                fmt = query.get("format", ["jpeg"])[0]
+                if fmt not in ("jpeg", "png"):
+                    self.send_json({"error": f"Unknown format '{fmt}'"}, 400)
+                    return
+                try:
+                    quality = int(query.get("quality", ["80"])[0])
+                except ValueError:
+                    quality = None
+                if quality is None or not 1 <= quality <= 100:
+                    self.send_json({"error": "quality must be an integer between 1 and 100"}, 400)
+                    return
+                data, render_time, encode_time = vtk_thread.submit(render_frame, client, fmt, quality).result()
+                with lock:
+                    timings["render"].append(render_time)
+                    timings["encode"].append(encode_time)
+                self.send_response(200)
+                self.send_header("Content-Type", f"image/{fmt}")
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("X-Render-Time", f"{render_time:.6f}")
+                self.send_header("X-Encode-Time", f"{encode_time:.6f}")
+                self.end_headers()
+                self.wfile.write(data)
+            elif url.path == "/stats":
+                with lock:
+                    self.send_json({"frames": len(timings["render"]), "clients": len(cameras),
+                                    "render": summarize(list(timings["render"])),
+                                    "encode": summarize(list(timings["encode"]))})
+            else:
+                self.send_json({"error": f"Unknown path '{url.path}'"}, 404)
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            try:
+                event = self.read_json()
+            except ValueError:
+                self.send_json({"error": "Invalid JSON"}, 400)
+                return
+            if url.path not in ("/camera", "/selection"):
+                self.send_json({"error": f"Unknown path '{url.path}'"}, 404)
+                return
+            if not isinstance(event, dict):
+                self.send_json({"error": "The event must be a JSON object"}, 400)
+                return
+            # A malformed event raises while it is applied; the client's stored camera is only
+            # replaced once the whole event succeeded
+            try:
+                if url.path == "/camera":
+                    client = query.get("client", ["default"])[0]
+                    self.send_json(vtk_thread.submit(update_camera, client, event).result())
+                else:
+                    vtk_thread.submit(apply_selection, scene, event).result()
+                    self.send_json({"ok": True})
+            except (TypeError, ValueError, AttributeError) as error:
+                self.send_json({"error": f"Invalid {url.path[1:]} event: {error}"}, 400)
+
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.daemon_threads = True
+    return server
+
+def serve(scene, host="127.0.0.1", port=8765):
+    """ Run the render server until interrupted """
+    server = create_render_server(scene, host, port)
+    print(f"Render server listening on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+##################################################################
+# -------------------------LOCAL CLIENT------------------------- #
+##################################################################
+def request_frame(url, client="default", fmt="jpeg", quality=80):
+    """ Fetch one frame; returns (image bytes, round trip seconds, server encode seconds) """
+    start = time.perf_counter()
+    with urllib.request.urlopen(f"{url}/frame?client={client}&format={fmt}&quality={quality}") as response:
+        data = response.read()
+        encode_time = float(response.headers["X-Encode-Time"])
+    return data, time.perf_counter() - start, encode_time
+
+def post_event(url, path, event, client="default"):
+    """ Send a camera or selection event and return the decoded JSON answer """
+    request = urllib.request.Request(f"{url}{path}?client={client}", data=json.dumps(event).encode(),
+                                     headers={"Content-Type": "application/json"}, method="POST")
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+def run_stand_in_client(url, client="default", n_frames=36, step=10.0, fmt="jpeg"):
+    """ Orbit the camera of one client, fetching a frame per step, and report latencies """
+    round_trips, encodes, sizes = [], [], []
+    for _ in range(n_frames):
+        post_event(url, "/camera", {"azimuth": step}, client)
+        data, round_trip, encode_time = request_frame(url, client, fmt)
+        round_trips.append(round_trip)
+        encodes.append(encode_time)
+        sizes.append(len(data))
+    return {"frames": n_frames, "round_trip": summarize(round_trips), "encode": summarize(encodes),
+            "mean_bytes": sum(sizes) / len(sizes) if sizes else 0}
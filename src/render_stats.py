@@ -0,0 +1,139 @@
+import csv, time
+from collections import deque
+from vtkmodules.vtkRenderingCore import vtkTextActor
+
+##################################################################
+# ----------------------SCENE STATISTICS------------------------ #
+##################################################################
+def actor_statistics(actor):
+    """ Return (points, cells) of the polydata drawn by an actor """
+    mapper = actor.GetMapper()
+    if mapper is None:
+        return 0, 0
+    data = mapper.GetInput()
+    if data is None:
+        return 0, 0
+    return data.GetNumberOfPoints(), data.GetNumberOfCells()
+
+def collect_scene_statistics(renderer):
+    """ Count visible actors, points and cells in a renderer and find the heaviest actor """
+    stats = {"actors": 0, "props": 0, "points": 0, "cells": 0, "max_cells": 0}
+
+    actors = renderer.GetActors()
+    actors.InitTraversal()
+    for _ in range(actors.GetNumberOfItems()):
+        actor = actors.GetNextActor()
+        if not actor.GetVisibility():
+            continue
+        n_points, n_cells = actor_statistics(actor)
+        stats["actors"] += 1
+        stats["points"] += n_points
+        stats["cells"] += n_cells
+        stats["max_cells"] = max(stats["max_cells"], n_cells)
+
+    props = renderer.GetViewProps()
+    props.InitTraversal()
+    for _ in range(props.GetNumberOfItems()):
+        if props.GetNextProp().GetVisibility():
+            stats["props"] += 1
+    return stats
+
+def format_statistics(fps, render_time, stats):
+    """ Build the text shown in the overlay """
+    return (f"FPS: {fps:.1f}\n"
+            f"Last render: {render_time * 1000:.1f} ms\n"
+            f"Actors: {stats['actors']} (props: {stats['props']})\n"
+            f"Points: {stats['points']:,}\n"
+            f"Cells: {stats['cells']:,}\n"
+            f"Largest actor: {stats['max_cells']:,} cells")
+
+##################################################################
+# --------------------------OVERLAY----------------------------- #
+##################################################################
+def create_stats_text_actor():
+    """ Create the 2D text actor used by the overlay (top left corner) """
+    text = vtkTextActor()
+    text.GetTextProperty().SetColor(0.1, 0.1, 0.1)
+    text.GetTextProperty().SetFontSize(14)
+    text.GetTextProperty().SetFontFamilyToCourier()
+    text.GetPositionCoordinate().SetCoordinateSystemToNormalizedViewport()
+    text.SetPosition(0.01, 0.80)
+    text.VisibilityOff()
+    return text
+
+def attach_stats_overlay(interactor, renderer, toggle_key="i", orbit_key="o",
+                         csv_path="frame_times.csv", fps_frames=30):
+    """ Add a render statistics overlay toggled with `toggle_key`.
+        FPS is averaged over the last `fps_frames` frames of the whole render window.
+        `orbit_key` runs a full camera orbit and writes the per-frame timings to `csv_path`.
+    """
+    text = create_stats_text_actor()
+    renderer.AddViewProp(text)
+    render_window = interactor.GetRenderWindow()
+    state = {"start": None, "frame_times": deque(maxlen=fps_frames)}
+
+    def update_text():
+        # Window frames include every renderer and the buffer swap; idle time between renders is not counted
+        total = sum(state["frame_times"])
+        fps = len(state["frame_times"]) / total if total > 0 else 0.0
+        text.SetInput(format_statistics(fps, renderer.GetLastRenderTimeInSeconds(),
+                                        collect_scene_statistics(renderer)))
+
+    def on_start_render(obj, event):
+        # Written before the props are drawn so the frame shows it. Counting walks every actor,
+        # so it only runs while the overlay is shown; it follows the interaction, selection and playback changes
+        if text.GetVisibility():
+            update_text()
+
+    def on_start_window(obj, event):
+        state["start"] = time.perf_counter()
+
+    def on_end_window(obj, event):
+        if state["start"] is not None:
+            state["frame_times"].append(time.perf_counter() - state["start"])
+
+    def on_key_press(obj, event):
+        key = obj.GetKeySym()
+        if key == toggle_key:
+            if not text.GetVisibility():
+                update_text()
+            text.SetVisibility(not text.GetVisibility())
+            obj.GetRenderWindow().Render()
+        elif key == orbit_key:
+            record_orbit(obj.GetRenderWindow(), renderer, csv_path)
+            print(f"Frame timings written to {csv_path}")
+
+    renderer.AddObserver("StartEvent", on_start_render)
+    render_window.AddObserver("StartEvent", on_start_window)
+    render_window.AddObserver("EndEvent", on_end_window)
+    interactor.AddObserver("KeyPressEvent", on_key_press)
+    return text
+
+##################################################################
+# ------------------------ORBIT LOGGING------------------------- #
+##################################################################
+def record_orbit(render_window, renderer, csv_path, n_frames=360, step=1.0):
+    """ Rotate the camera around the focal point, rendering each frame, and log timings to a CSV """
+    camera = renderer.GetActiveCamera()
+    stats = collect_scene_statistics(renderer)
+    rows = []
+    for frame in range(n_frames):
+        camera.Azimuth(step)
+        start = time.perf_counter()
+        render_window.Render()
+        wall_time = time.perf_counter() - start
+        rows.append({
+            "frame": frame,
+            "wall_time_s": wall_time,
+            "render_time_s": renderer.GetLastRenderTimeInSeconds(),
+            "fps": 1.0 / wall_time if wall_time > 0 else 0.0,
+            "actors": stats["actors"],
+            "points": stats["points"],
+            "cells": stats["cells"],
+        })
+
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["frame"])
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
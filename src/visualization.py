@@ -1,24 +1,63 @@
-import vtk
+# Rendering backends: the OpenGL2 render window and FreeType text rendering register themselves
+# in the VTK object factory when their module is imported
+import vtkmodules.vtkRenderingOpenGL2  # noqa: F401
+import vtkmodules.vtkRenderingFreeType  # noqa: F401
+import weakref
+from vtkmodules.vtkCommonCore import vtkLookupTable
+from vtkmodules.vtkFiltersSources import vtkLineSource, vtkRegularPolygonSource
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
+from vtkmodules.vtkRenderingAnnotation import vtkScalarBarActor
+from vtkmodules.vtkRenderingCore import (vtkActor, vtkBillboardTextActor3D, vtkPolyDataMapper,
+                                         vtkRenderWindow, vtkRenderWindowInteractor, vtkRenderer)
 
 def create_renderer():
     """ Creates and returns a VTK renderer """
-    renderer = vtk.vtkRenderer()
+    renderer = vtkRenderer()
     renderer.SetBackground(1.0, 1.0, 1.0)  # white background
     return renderer
 
 def create_render_window(renderer):
     """ Creates and returns a VTK render window """
-    render_window = vtk.vtkRenderWindow()
+    render_window = vtkRenderWindow()
     render_window.AddRenderer(renderer)
     render_window.SetSize(800, 700)
     return render_window
 
+# Strategies to draw translucent discs, from cheapest to most accurate:
+#   opaque        -> no translucent pass at all, discs are opaque with an outline
+#   blend         -> plain alpha blending, result depends on draw order
+#   oit           -> weighted order-independent transparency in a single pass (VTK default)
+#   depth_peeling -> exact dual depth peeling, bounded by `max_peels`
+TRANSPARENCY_MODES = ("opaque", "blend", "oit", "depth_peeling")
+
+# (alpha bit planes, multisamples) of windows switched to depth peeling, restored by the other modes
+_window_settings = weakref.WeakKeyDictionary()
+
+def configure_transparency(renderer, render_window, mode="oit", max_peels=4, occlusion_ratio=0.1):
+    """ Configure how the renderer draws translucent geometry """
+    if mode not in TRANSPARENCY_MODES:
+        raise ValueError(f"Unknown transparency mode '{mode}', expected one of {TRANSPARENCY_MODES}")
+
+    renderer.SetUseDepthPeeling(mode == "depth_peeling")
+    renderer.SetUseOIT(mode == "oit")
+    if mode == "depth_peeling":
+        _window_settings.setdefault(render_window, (render_window.GetAlphaBitPlanes(),
+                                                    render_window.GetMultiSamples()))
+        render_window.SetAlphaBitPlanes(1)
+        render_window.SetMultiSamples(0)
+        renderer.SetMaximumNumberOfPeels(max_peels)
+        renderer.SetOcclusionRatio(occlusion_ratio)
+    elif render_window in _window_settings:
+        alpha_bit_planes, multisamples = _window_settings.pop(render_window)
+        render_window.SetAlphaBitPlanes(alpha_bit_planes)
+        render_window.SetMultiSamples(multisamples)
+
 def create_interactor(render_window):
     """ Creates and returns a VTK render window interactor """
-    interactor = vtk.vtkRenderWindowInteractor()
+    interactor = vtkRenderWindowInteractor()
     interactor.SetRenderWindow(render_window)
     
-    style = vtk.vtkInteractorStyleTrackballCamera()
+    style = vtkInteractorStyleTrackballCamera()
     interactor.SetInteractorStyle(style)
     
     return interactor
@@ -26,14 +65,14 @@ def create_interactor(render_window):
 def create_potential_legend():
     """Creates and return a color bar (legend) for the potencial."""
     # Create the colormap (blue to red)
-    lut = vtk.vtkLookupTable()
+    lut = vtkLookupTable()
     lut.SetNumberOfTableValues(256)
     lut.SetTableRange(0.0, 1.0)
     lut.SetHueRange(0.667, 0.0) 
     lut.Build()
 
     # Create color bar
-    scalar_bar = vtk.vtkScalarBarActor()
+    scalar_bar = vtkScalarBarActor()
     scalar_bar.SetLookupTable(lut)
     scalar_bar.SetTitle("Potential")
     scalar_bar.SetNumberOfLabels(5)
@@ -59,21 +98,21 @@ def create_wind_rose(center, size=500):
 
     # Create cardinal lines
     for label, (dx, dy, dz) in directions.items():
-        line_source = vtk.vtkLineSource()
+        line_source = vtkLineSource()
         line_source.SetPoint1(cx, cy, cz)
         line_source.SetPoint2(cx + dx, cy + dy, cz + dz)
         
-        mapper = vtk.vtkPolyDataMapper()
+        mapper = vtkPolyDataMapper()
         mapper.SetInputConnection(line_source.GetOutputPort())
         
-        actor = vtk.vtkActor()
+        actor = vtkActor()
         actor.SetMapper(mapper)
         actor.GetProperty().SetColor(0, 0, 0)  
         actor.GetProperty().SetLineWidth(3)
         actors.append(actor)
         
         # Create labels
-        text = vtk.vtkBillboardTextActor3D()
+        text = vtkBillboardTextActor3D()
         text.SetInput(label)
         text.SetPosition(cx + dx * 1.1, cy + dy * 1.1, cz + dz * 1.05)
         text.GetTextProperty().SetColor(0, 0, 0)
@@ -82,16 +121,16 @@ def create_wind_rose(center, size=500):
         actors.append(text)
 
     # Circle at the center to highlight
-    circle = vtk.vtkRegularPolygonSource()
+    circle = vtkRegularPolygonSource()
     circle.SetCenter(cx, cy, cz)
     circle.SetRadius(size * 0.1)
     circle.SetNumberOfSides(50)
     circle.Update()
 
-    circle_mapper = vtk.vtkPolyDataMapper()
+    circle_mapper = vtkPolyDataMapper()
     circle_mapper.SetInputConnection(circle.GetOutputPort())
 
-    circle_actor = vtk.vtkActor()
+    circle_actor = vtkActor()
     circle_actor.SetMapper(circle_mapper)
     circle_actor.GetProperty().SetColor(0, 0, 0)
     circle_actor.GetProperty().SetOpacity(1)
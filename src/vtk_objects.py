@@ -1,9 +1,13 @@
-import vtk
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkLine, vtkPolyData
+from vtkmodules.vtkFiltersCore import vtkAppendPolyData
+from vtkmodules.vtkFiltersSources import vtkRegularPolygonSource
 import src.geometry as geometry
 import src.colors as colors
 import src.group_points as group_points
 import src.actors as actors
-from vtk.util import numpy_support #type: ignore
+import numpy as np
+from vtkmodules.util import numpy_support #type: ignore
 
 ##################################################################
 # -----------------------DATA EXTRACTION------------------------ #
@@ -35,9 +39,9 @@ def convert_to_vtk_arrays(coords, marker_ids, azimuth, dip):
 
 def build_points_polydata(vtk_coords, marker_fault_array, azimiuth_array, dip_array):
     """ Build a vtkPolyData object with points and attribute arrays"""
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     points.SetData(vtk_coords)
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
     polydata.SetPoints(points)
     
     # Associate the set of values with the points I already have in polydata
@@ -55,6 +59,12 @@ def create_points(well_data):
     coords, marker_ids, azimuth, dip, unique_markers = extract_numpy_arrays(well_data)
     vtk_coords, marker_fault_array, azimiuth_array, dip_array = convert_to_vtk_arrays(coords, marker_ids, azimuth, dip)
     polydata = build_points_polydata(vtk_coords, marker_fault_array, azimiuth_array, dip_array)
+
+    # Clustered observations carry the number of picks each disc represents
+    if "Count" in well_data.columns:
+        count_array = numpy_support.numpy_to_vtk(well_data["Count"].to_numpy(dtype=int))
+        count_array.SetName("Count")
+        polydata.GetPointData().AddArray(count_array)
     return polydata, unique_markers
 
 ##################################################################
@@ -63,7 +73,7 @@ def create_points(well_data):
 
 def prepare_disc_template(radius, resolution):
     """ Create and return the base disc geomtery used for all wells"""
-    base_disc = vtk.vtkRegularPolygonSource()
+    base_disc = vtkRegularPolygonSource()
     base_disc.SetCenter(0.0, 0.0, 0.0)
     base_disc.SetRadius(radius)
     base_disc.SetNumberOfSides(resolution)
@@ -73,13 +83,17 @@ def prepare_disc_template(radius, resolution):
 
 def build_marker_geometries(points, base_disc, transformed_fn):
     """ Create combined disc geometry and a list of line polydata for all points of a given marker.
+        Every disc cell carries a 'Count' cell array with the number of picks the disc represents.
         Returns: (append_discs_polydata, list_of_line_polydata)
     """
-    append_discs = vtk.vtkAppendPolyData()
+    append_discs = vtkAppendPolyData()
     line_polydatas = []  # collect each line polydata (strike and dip as separate entries)
 
-    for (x, y, z, azimuth, dip) in points:
+    for (x, y, z, azimuth, dip, count) in points:
         disc_geom, strike_geom, dip_geom = transformed_fn(base_disc, x, y, z, azimuth, dip)
+        count_array = numpy_support.numpy_to_vtk(np.full(disc_geom.GetNumberOfCells(), count, dtype=int))
+        count_array.SetName("Count")
+        disc_geom.GetCellData().AddArray(count_array)
         append_discs.AddInputData(disc_geom)
         # collect the strike and dip separate polydata objects (already translated by transformed_fn)
         line_polydatas.append(strike_geom)
@@ -90,25 +104,32 @@ def build_marker_geometries(points, base_disc, transformed_fn):
     return discs_out, line_polydatas
     
 
-def create_disc_line_actors(polydata, unique_markers, radius=200, resolution=40,
-                               line_color=(0, 0, 0), line_width=2.0):
-    """ Build actors for discs and lines """
+def create_disc_line_actors_by_marker(polydata, unique_markers, radius=200, resolution=40,
+                                      line_color=(0, 0, 0), line_width=2.0, transparency="oit"):
+    """ Build actors for discs and lines, grouped in a dict {marker name: [disc actor, line actors...]}.
+        `transparency` is one of visualization.TRANSPARENCY_MODES; "opaque" draws outlined opaque discs
+    """
     n_colors = len(unique_markers)
     color_table = colors.generate_distinct_colors(n_colors)
     marker_to_points = group_points.group_points_by_marker(polydata, n_colors)
+    marker_names = {i: name for name, i in unique_markers.items()}
 
     base_disc = prepare_disc_template(radius, resolution)
-    actors_ = []
+    marker_actors = {}
 
     for marker_index, points in marker_to_points.items():
         if not points:
             continue
 
         disc_geom, line_polydatas = build_marker_geometries(points, base_disc, geometry.create_transformed_geometry)
+        actors_ = []
 
         # Disc actor
         disc_color = color_table.GetTableValue(marker_index)
-        disc_actor = actors.create_actor(disc_geom, color=disc_color, line=False)
+        if transparency == "opaque":
+            disc_actor = actors.create_actor(disc_geom, color=disc_color, line=False, opacity=1.0, outline=True)
+        else:
+            disc_actor = actors.create_actor(disc_geom, color=disc_color, line=False)
         actors_.append(disc_actor)
 
         # Create separate actors for each line polydata (strike and dip)
@@ -116,7 +137,13 @@ def create_disc_line_actors(polydata, unique_markers, radius=200, resolution=40,
             # create tube-based line actor for visibility
             line_actor = actors.create_actor(line_pd, color=line_color, line=True, line_width=line_width)
             actors_.append(line_actor)
-    return actors_
+        marker_actors[marker_names[marker_index]] = actors_
+    return marker_actors
+
+def create_disc_line_actors(polydata, unique_markers, **kwargs):
+    """ Build actors for discs and lines as a flat list """
+    marker_actors = create_disc_line_actors_by_marker(polydata, unique_markers, **kwargs)
+    return [actor for actors_ in marker_actors.values() for actor in actors_]
 
 ##################################################################
 # -------------------------WELL LINES--------------------------- #
@@ -124,18 +151,18 @@ def create_disc_line_actors(polydata, unique_markers, radius=200, resolution=40,
 
 def build_well_polyline(subset):
     """ Create vtkPolyData for the well trajectory """
-    points = vtk.vtkPoints()
+    points = vtkPoints()
     for _, row in subset.iterrows():
         points.InsertNextPoint(row["X"], row["Y"], row["Z"])
         
-    lines = vtk.vtkCellArray()
+    lines = vtkCellArray()
     for i in range(len(subset) - 1):
-        line = vtk.vtkLine()
+        line = vtkLine()
         line.GetPointIds().SetId(0, i)
         line.GetPointIds().SetId(1, i + 1)
         lines.InsertNextCell(line)
         
-    polydata = vtk.vtkPolyData()
+    polydata = vtkPolyData()
     polydata.SetPoints(points)
     polydata.SetLines(lines)
     return polydata
@@ -1,4 +1,3 @@
-import pandas as pd
 import glob
 import os
 
@@ -12,22 +11,39 @@ file_txt = ("C:/Users/paope/Documents/Intercambio/Proyecto Octubre - Noviembre/"
 
 def load_well_data():
     """ Loads well data from a .csv and returns a dataframe """
+    import pandas as pd
     return pd.read_csv(file_path)
 
 def load_well_trajectories():
     """ Loads well trajectories data from a .txt and returns a dataframe """
+    import pandas as pd
     return pd.read_csv(file_txt, sep=r'\s+')
 
 # Folder path for edge .csv files
 folder_path = os.path.join("C:/Users/paope/Documents/Intercambio/Proyecto Octubre - Noviembre/",
                            "WellVisualisationProject/WellVisualisationProject/edges")
 
-# Get all .csv files in the folder
-csv_files = glob.glob(os.path.join(folder_path, "*.csv"))
-
-# Read each file and store DataFrames in a list
-edges = []
-for file in csv_files:
-    df = pd.read_csv(file)
-    edges.append(df)
+def load_edges():
+    """ Reads every edge .csv file in the folder and returns a list of dataframes """
+    import pandas as pd
+    return [pd.read_csv(file) for file in _lazy_attribute("csv_files")]
+
+_lazy_attributes = {
+    # Get all .csv files in the folder
+    "csv_files": lambda: glob.glob(os.path.join(folder_path, "*.csv")),
+    # Read each file and store DataFrames in a list
+    "edges": load_edges,
+}
+
+def _lazy_attribute(name):
+    """ Compute a lazy module attribute once and keep it as a regular global """
+    if name not in globals():
+        globals()[name] = _lazy_attributes[name]()
+    return globals()[name]
+
+def __getattr__(name):
+    """ `csv_files` and `edges` are only read the first time they are accessed """
+    if name in _lazy_attributes:
+        return _lazy_attribute(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pandas as pd
+from src.clustering import cluster_observations, compute_poles, pole_to_orientation
+from src.vtk_objects import create_points
+
+# Ten nearly identical picks of marker A, one pick of A far away and one with a different dip,
+# plus one pick of marker B at the same place as the dense group
+rows = [{"WellName": "W1", "X": 0.0, "Y": 0.0, "Z": -1000.0 - i, "MarkerName": "A",
+         "Azimuth": 120.0 + 0.5 * i, "Dip": 30.0} for i in range(10)]
+rows.append({"WellName": "W1", "X": 0.0, "Y": 0.0, "Z": -3000.0, "MarkerName": "A", "Azimuth": 120.0, "Dip": 30.0})
+rows.append({"WellName": "W1", "X": 0.0, "Y": 0.0, "Z": -1002.0, "MarkerName": "A", "Azimuth": 120.0, "Dip": 75.0})
+rows.append({"WellName": "W1", "X": 0.0, "Y": 0.0, "Z": -1002.0, "MarkerName": "B", "Azimuth": 120.0, "Dip": 30.0})
+well_data = pd.DataFrame(rows)
+
+clustered = cluster_observations(well_data, distance_tolerance=200.0, angle_tolerance=10.0)
+
+# Test 1: Dense group collapses, far / differently oriented picks and other markers stay apart
+assert len(clustered) == 4, f"Expected 4 clusters, found {len(clustered)}"
+assert clustered["Count"].sum() == len(well_data), "Every pick must belong to exactly one cluster"
+assert sorted(clustered["Count"]) == [1, 1, 1, 10]
+
+# Test 2: The representative disc has the mean position and mean orientation
+dense = clustered[clustered["Count"] == 10].iloc[0]
+assert np.isclose(dense["Z"], well_data["Z"][:10].mean())
+assert abs(dense["Azimuth"] - 122.25) < 0.1, f"Unexpected mean azimuth {dense['Azimuth']}"
+assert abs(dense["Dip"] - 30.0) < 0.1, f"Unexpected mean dip {dense['Dip']}"
+
+# Test 3: Orientation round trip through the pole vector
+pole = compute_poles([200.0], [45.0])[0]
+azimuth, dip = pole_to_orientation(pole)
+assert np.isclose(azimuth, 200.0) and np.isclose(dip, 45.0)
+
+# Test 4: The count is stored as a point array
+polydata, unique_markers = create_points(clustered)
+count_array = polydata.GetPointData().GetArray("Count")
+assert count_array is not None and count_array.GetNumberOfTuples() == len(clustered)
+
+# Test 5: Every representative disc carries its count as a cell array
+from src.vtk_objects import create_disc_line_actors_by_marker
+from vtkmodules.util import numpy_support #type: ignore
+marker_actors = create_disc_line_actors_by_marker(polydata, unique_markers)
+disc_counts = numpy_support.vtk_to_numpy(
+    marker_actors["A"][0].GetMapper().GetInput().GetCellData().GetArray("Count"))
+assert sorted(set(disc_counts)) == [1, 10], f"Unexpected disc counts {set(disc_counts)}"
+
+# Test 6: Duplicated index labels do not break clustering
+duplicated = pd.concat([well_data, well_data])
+assert cluster_observations(duplicated)["Count"].sum() == len(duplicated)
+
+# Test 7: A tolerance <= 0 keeps every pick
+for tolerance in (0.0, -5.0):
+    unchanged = cluster_observations(well_data, distance_tolerance=tolerance)
+    assert len(unchanged) == len(well_data) and (unchanged["Count"] == 1).all()
+    assert unchanged[["X", "Y", "Z"]].equals(well_data[["X", "Y", "Z"]])
+
+# Test 8: A cluster whose centroid drifts away from its first pick still collects nearby picks
+xs = [9.9] + [19.0] * 10 + [28.0] * 30 + [35.0]
+drift = pd.DataFrame({"WellName": "W1", "X": xs, "Y": 0.0, "Z": 0.001 * np.arange(len(xs)),
+                      "MarkerName": "A", "Azimuth": 0.0, "Dip": 10.0})
+drifted = cluster_observations(drift, distance_tolerance=10.0, angle_tolerance=10.0)
+assert len(drifted) == 1, f"Expected a single cluster, found {len(drifted)}"
@@ -0,0 +1,111 @@
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pandas as pd
+from vtk.util import numpy_support #type: ignore
+from src.edges import (connect_edges_with_potential, group_edges_by_topology, ordered_potentials,
+                       build_edge_playback, set_playback_step)
+
+def edge_file(potentials, shift=0.0):
+    """ Network of 4 two-point segments (Seg_id 0 is ignored) listed in shuffled Seg_id order """
+    seg_ids = [3, 3, 1, 1, 0, 0, 2, 2, 4, 4]
+    return pd.DataFrame({
+        "Seg_id": seg_ids,
+        "X": np.arange(10, dtype=float) + shift,
+        "Y": np.zeros(10),
+        "Z": np.zeros(10),
+        "potential": potentials,
+        "point": np.arange(10),
+    })
+
+rng = np.random.default_rng(0)
+steps = [edge_file(rng.random(10)) for _ in range(3)]
+other = edge_file(rng.random(10), shift=1.0)
+edges_list = steps + [other]
+
+# Test 1: Files are grouped by topology, not by potential
+groups = group_edges_by_topology(edges_list, [0, 1, 2, 3])
+assert sorted(groups.values()) == [[0, 1, 2], [3]], f"Unexpected topology groups {groups}"
+
+# Test 2: Potentials are ordered like the points built by connect_edges_with_potential
+for df in steps:
+    polydata = connect_edges_with_potential(df)
+    built = numpy_support.vtk_to_numpy(polydata.GetPointData().GetArray("potential"))
+    assert np.allclose(built, ordered_potentials(df)), "Playback potentials are not in point order"
+
+# Test 3: Stepping swaps the scalars and keeps the geometry
+polydata, arrays = build_edge_playback(edges_list, [0, 1, 2], connect_edges_with_potential)
+assert len(arrays) == 3
+points = polydata.GetPoints()
+for step, df in enumerate(steps):
+    set_playback_step(polydata, arrays, step)
+    assert polydata.GetPoints() is points, "The geometry should not be rebuilt"
+    shown = numpy_support.vtk_to_numpy(polydata.GetPointData().GetScalars())
+    assert np.allclose(shown, ordered_potentials(df)), f"Step {step} shows the wrong potential"
+
+# ----------------------------------------------------------------------------------------------------------------------------
+from src.edges import connect_welded_edges, segment_endpoints
+
+# Chain of 3 segments sharing their inner nodes: 0-1, 1-2, 2-3 (Seg_id 0 is ignored)
+chain = pd.DataFrame({
+    "Seg_id": [1, 1, 2, 2, 3, 3, 0, 0],
+    "X": [0.0, 1.0, 1.0, 2.0, 2.0, 3.0, 5.0, 6.0],
+    "Y": np.zeros(8),
+    "Z": np.zeros(8),
+    "potential": [0.1, 0.2, 0.4, 0.5, 0.6, 0.9, 1.0, 1.0],
+    "point": np.arange(8),
+})
+
+# Test 4: Coincident endpoints are welded into shared points
+welded = connect_welded_edges(chain, "mean")
+assert welded.GetNumberOfPoints() == 4, f"Expected 4 shared points, found {welded.GetNumberOfPoints()}"
+assert welded.GetNumberOfCells() == 3
+coords, _ = segment_endpoints(chain)
+assert len(coords) == 6
+
+# Test 5: Conflicting potentials follow the chosen rule
+mean = numpy_support.vtk_to_numpy(welded.GetPointData().GetScalars())
+assert np.allclose(mean, [0.1, 0.3, 0.55, 0.9]), f"Unexpected mean potentials {mean}"
+highest = numpy_support.vtk_to_numpy(connect_welded_edges(chain, "max").GetPointData().GetScalars())
+assert np.allclose(highest, [0.1, 0.4, 0.6, 0.9]), f"Unexpected max potentials {highest}"
+per_cell = connect_welded_edges(chain, "cell")
+assert per_cell.GetPointData().GetScalars() is None
+assert np.allclose(numpy_support.vtk_to_numpy(per_cell.GetCellData().GetScalars()), [0.15, 0.45, 0.75])
+
+# Test 6: Welded playback keeps the shared points and swaps merged potentials
+chain_steps = [chain, chain.assign(potential=chain["potential"] * 0.5)]
+polydata, arrays = build_edge_playback(chain_steps, [0, 1], connect_edges_with_potential, weld="mean")
+assert polydata.GetNumberOfPoints() == 4
+set_playback_step(polydata, arrays, 1)
+shown = numpy_support.vtk_to_numpy(polydata.GetPointData().GetScalars())
+assert np.allclose(shown, np.array([0.1, 0.3, 0.55, 0.9]) * 0.5)
+
+# ----------------------------------------------------------------------------------------------------------------------------
+from src.edges import attach_playback_controls, create_edge_actor
+from src.visualization import create_renderer, create_render_window, create_interactor, create_potential_legend
+
+_, lut = create_potential_legend()
+polydata, arrays = build_edge_playback(edges_list, [0, 1, 2], connect_edges_with_potential)
+renderer = create_renderer()
+renderer.AddActor(create_edge_actor(polydata, lut))
+render_window = create_render_window(renderer)
+render_window.SetOffScreenRendering(1)
+interactor = create_interactor(render_window)
+render_window.Render()
+widget = attach_playback_controls(interactor, polydata, arrays)
+
+# Test 7: Only the playback timer advances the time step
+created = []
+create_timer = interactor.CreateRepeatingTimer
+interactor.CreateRepeatingTimer = lambda interval: created.append(create_timer(interval)) or created[-1]
+interactor.SetKeySym("space")
+interactor.InvokeEvent("KeyPressEvent")
+foreign_timer = create_timer(1000)
+interactor.SetTimerEventId(foreign_timer)
+interactor.InvokeEvent("TimerEvent")
+assert polydata.GetPointData().GetScalars() is arrays[0], "A foreign timer advanced the playback"
+interactor.SetTimerEventId(created[0])
+interactor.InvokeEvent("TimerEvent")
+assert polydata.GetPointData().GetScalars() is arrays[1], "The playback timer did not advance the playback"
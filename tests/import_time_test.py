@@ -0,0 +1,35 @@
+# Import-time benchmark based on `python -X importtime`
+import sys
+import os
+import subprocess
+
+root = os.path.join(os.path.dirname(__file__), "..")
+
+def import_times(statement):
+    """ Run `statement` in a fresh interpreter and return {module: cumulative import time in us} """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=root, capture_output=True, text=True)
+    assert result.returncode == 0, f"'{statement}' failed:\n{result.stderr}"
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+package_times = import_times("import main")
+full_vtk_times = import_times("import vtk")
+
+# Test 1: Only the needed vtkmodules are imported, never the full wrapping
+assert "vtk" not in package_times, "A module imports the full 'vtk' package, use vtkmodules instead"
+assert "vtkmodules.all" not in package_times, "A module imports 'vtkmodules.all'"
+
+# Test 2: pandas and the data files are only loaded on first use
+assert "pandas" not in package_times, "pandas should not be imported at import time"
+
+# Test 3: Importing the whole application is faster than importing vtk alone
+main_ms = package_times["main"] / 1000
+vtk_ms = full_vtk_times["vtk"] / 1000
+print(f"import main: {main_ms:.0f} ms, import vtk: {vtk_ms:.0f} ms")
+assert main_ms < vtk_ms, f"Importing the application ({main_ms:.0f} ms) is slower than 'import vtk' ({vtk_ms:.0f} ms)"
@@ -0,0 +1,133 @@
+import vtk
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.visualization import create_renderer, create_render_window, create_interactor
+from src.actors import create_actor
+from src.interaction import split_disc_line_actors, select_labels, enable_interactive_detail
+
+# Small scene: one disc, one strike line, one label and an edge network of 100 lines
+disc = vtk.vtkRegularPolygonSource()
+disc.Update()
+disc_actor = create_actor(disc.GetOutput(), color=(1, 0, 0), line=False)
+
+line = vtk.vtkLineSource()
+line.Update()
+line_actor = create_actor(line.GetOutput(), line=True)
+
+label = vtk.vtkBillboardTextActor3D()
+label.SetInput("W1")
+
+edge_lines = vtk.vtkPolyData()
+edge_points = vtk.vtkPoints()
+edge_cells = vtk.vtkCellArray()
+for i in range(100):
+    id0 = edge_points.InsertNextPoint(i, 0, 0)
+    id1 = edge_points.InsertNextPoint(i, 1, 0)
+    edge_cells.InsertNextCell(2, [id0, id1])
+edge_lines.SetPoints(edge_points)
+edge_lines.SetLines(edge_cells)
+edge_mapper = vtk.vtkPolyDataMapper()
+edge_mapper.SetInputData(edge_lines)
+edge_actor = vtk.vtkActor()
+edge_actor.SetMapper(edge_mapper)
+
+# Test 1: Disc and strike/dip actors are told apart
+discs, lines = split_disc_line_actors([disc_actor, line_actor])
+assert discs == [disc_actor] and lines == [line_actor]
+assert select_labels([disc_actor, label]) == [label]
+
+renderer = create_renderer()
+renderer.AddActor(disc_actor)
+render_window = create_render_window(renderer)
+render_window.SetOffScreenRendering(1)
+interactor = create_interactor(render_window)
+enable_interactive_detail(interactor, disc_actors=discs, hidden_actors=lines + [label],
+                          edge_actors=[edge_actor], edge_ratio=10,
+                          desired_update_rate=20.0, still_update_rate=0.01)
+
+# Test 2: Update rates are set on the interactor
+assert interactor.GetDesiredUpdateRate() == 20.0
+assert interactor.GetStillUpdateRate() == 0.01
+
+# Test 3: Lightweight representation while interacting
+style = interactor.GetInteractorStyle()
+property_mtime = disc_actor.GetProperty().GetMTime()
+center_actor = [a for a in (renderer.GetActors().GetItemAsObject(i) for i in range(renderer.GetActors().GetNumberOfItems()))
+                if a is not disc_actor][0]
+assert not center_actor.GetVisibility()
+style.InvokeEvent("StartInteractionEvent")
+assert not disc_actor.GetVisibility() and center_actor.GetVisibility(), "Discs should be swapped for their centres"
+centers = center_actor.GetMapper().GetInput()
+assert centers.GetNumberOfPoints() == 1 and centers.GetNumberOfVerts() == 1, "Expected one point per disc"
+assert max(abs(c) for c in centers.GetPoint(0)) < 1e-9, "The point should be at the disc centre"
+assert disc_actor.GetProperty().GetMTime() == property_mtime, "The disc property should not be modified"
+assert not line_actor.GetVisibility() and not label.GetVisibility()
+assert edge_mapper.GetInput().GetNumberOfCells() == 10, \
+    f"Expected 10 decimated edges, found {edge_mapper.GetInput().GetNumberOfCells()}"
+
+# Test 4: Full detail is restored when the interaction ends
+style.InvokeEvent("EndInteractionEvent")
+assert disc_actor.GetVisibility() and not center_actor.GetVisibility()
+assert disc_actor.GetProperty().GetRepresentation() == vtk.VTK_SURFACE
+assert disc_actor.GetProperty().GetMTime() == property_mtime
+assert line_actor.GetVisibility() and label.GetVisibility()
+assert edge_mapper.GetInput() is edge_lines
+
+# ----------------------------------------------------------------------------------------------------------------------------
+import numpy as np
+import pandas as pd
+from vtk.util import numpy_support #type: ignore
+from src.edges import connect_welded_edges, build_edge_playback, connect_edges_with_potential, set_playback_step
+
+# Chain of 20 segments welded with one potential per segment (cell data)
+n_segments = 20
+x = np.repeat(np.arange(n_segments + 1, dtype=float), 2)[1:-1]
+chain = pd.DataFrame({"Seg_id": np.repeat(np.arange(1, n_segments + 1), 2), "X": x,
+                      "Y": np.zeros(2 * n_segments), "Z": np.zeros(2 * n_segments),
+                      "potential": np.linspace(0, 1, 2 * n_segments)})
+steps = [chain, chain.assign(potential=1 - chain["potential"])]
+welded, arrays = build_edge_playback(steps, [0, 1], connect_edges_with_potential, weld="cell")
+assert welded.GetCellData().GetScalars() is not None
+
+welded_mapper = vtk.vtkPolyDataMapper()
+welded_mapper.SetInputData(welded)
+welded_actor = vtk.vtkActor()
+welded_actor.SetMapper(welded_mapper)
+
+interactor = create_interactor(render_window)
+enable_interactive_detail(interactor, edge_actors=[welded_actor], edge_ratio=10)
+style = interactor.GetInteractorStyle()
+
+# Test 5: Decimated "cell"-welded edges keep their potential cell scalars
+style.InvokeEvent("StartInteractionEvent")
+light = welded_mapper.GetInput()
+assert light.GetNumberOfCells() == 2
+light_potential = light.GetCellData().GetScalars()
+assert light_potential is not None, "Decimation dropped the cell potential"
+full_potential = numpy_support.vtk_to_numpy(arrays[0])
+assert np.allclose(numpy_support.vtk_to_numpy(light_potential), full_potential[::10])
+style.InvokeEvent("EndInteractionEvent")
+assert welded_mapper.GetInput() is welded
+
+# Test 6: A playback step is reflected in the decimated edges
+set_playback_step(welded, arrays, 1)
+style.InvokeEvent("StartInteractionEvent")
+stepped = numpy_support.vtk_to_numpy(welded_mapper.GetInput().GetCellData().GetScalars())
+assert np.allclose(stepped, numpy_support.vtk_to_numpy(arrays[1])[::10]), "Decimated edges show a stale step"
+style.InvokeEvent("EndInteractionEvent")
+
+# Test 7: One centre per disc of an appended marker geometry
+from src.interaction import disc_centers
+append = vtk.vtkAppendPolyData()
+for cx in (0.0, 500.0, 1000.0):
+    source = vtk.vtkRegularPolygonSource()
+    source.SetNumberOfSides(40)
+    source.SetRadius(200)
+    source.SetCenter(cx, 10.0, -5.0)
+    source.Update()
+    append.AddInputData(source.GetOutput())
+append.Update()
+centers = numpy_support.vtk_to_numpy(disc_centers(append.GetOutput()).GetPoints().GetData())
+assert np.allclose(centers, [[0, 10, -5], [500, 10, -5], [1000, 10, -5]]), f"Unexpected disc centres {centers}"
@@ -0,0 +1,115 @@
+import vtk
+import sys
+import os
+import json
+import threading
+import urllib.request
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.visualization import create_renderer, create_render_window
+from src.render_server import create_render_server, request_frame, post_event, run_stand_in_client
+from src.edges import create_edge_actor, build_edges_polydata, connect_edges_with_potential
+from src.visualization import create_potential_legend
+import pandas as pd
+
+# Small scene: one "marker" actor and an edge actor over two edge files
+sphere = vtk.vtkSphereSource()
+mapper = vtk.vtkPolyDataMapper()
+mapper.SetInputConnection(sphere.GetOutputPort())
+marker_actor = vtk.vtkActor()
+marker_actor.SetMapper(mapper)
+
+renderer = create_renderer()
+renderer.AddActor(marker_actor)
+render_window = create_render_window(renderer)
+
+edges_list = [pd.DataFrame({"Seg_id": [1, 1], "X": [0.0, 1.0], "Y": [0.0, 0.0], "Z": [0.0, 0.0], "potential": [0.2, 0.8]}),
+              pd.DataFrame({"Seg_id": [1, 1, 2, 2], "X": [0.0, 0.0, 1.0, 1.0], "Y": [0.0, 1.0, 0.0, 1.0],
+                            "Z": [0.0, 0.0, 0.0, 0.0], "potential": [0.1, 0.2, 0.3, 0.4]})]
+_, lut = create_potential_legend()
+edges_actor = create_edge_actor(build_edges_polydata(edges_list, [], connect_edges_with_potential), lut)
+renderer.AddActor(edges_actor)
+
+scene = {"renderer": renderer, "render_window": render_window, "marker_actors": {"Top_A": [marker_actor]},
+         "edges_actor": edges_actor, "edges_list": edges_list}
+
+# Port 0: let the OS pick a free port
+server = create_render_server(scene, port=0)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = f"http://127.0.0.1:{server.server_address[1]}"
+
+# Test 1: Frames are encoded as JPEG and PNG
+jpeg, round_trip, encode_time = request_frame(url, fmt="jpeg")
+assert jpeg[:2] == b"\xff\xd8", "Frame is not a JPEG image"
+assert round_trip >= encode_time >= 0
+png, _, _ = request_frame(url, fmt="png")
+assert png[:8] == b"\x89PNG\r\n\x1a\n", "Frame is not a PNG image"
+
+# Test 2: Every client has its own camera
+camera_a = post_event(url, "/camera", {"azimuth": 90}, client="a")
+camera_b = post_event(url, "/camera", {"elevation": 30}, client="b")
+assert camera_a["position"] != camera_b["position"], "Clients should not share the camera"
+assert post_event(url, "/camera", {}, client="a") == camera_a, "Camera of client 'a' was changed by client 'b'"
+
+# Test 2b: A zoom only changes the view of the client that asked for it
+frame_b, _, _ = request_frame(url, client="b", fmt="png")
+zoomed = post_event(url, "/camera", {"zoom": 3}, client="a")
+assert abs(zoomed["view_angle"] - camera_a["view_angle"] / 3) < 5, "Zoom should narrow the view angle of client 'a'"
+assert request_frame(url, client="b", fmt="png")[0] == frame_b, "Zoom of client 'a' changed the frame of client 'b'"
+assert post_event(url, "/camera", {}, client="b") == camera_b, "Zoom of client 'a' changed the camera of client 'b'"
+camera_a = zoomed
+
+# Test 3: Selection events change marker visibility
+assert post_event(url, "/selection", {"markers": {"Top_A": False}}) == {"ok": True}
+assert not marker_actor.GetVisibility()
+post_event(url, "/selection", {"markers": {"Top_A": True}})
+assert marker_actor.GetVisibility()
+
+# Test 4: Selection events choose which edge files are drawn
+post_event(url, "/selection", {"edges": [0, 1]})
+assert edges_actor.GetMapper().GetInput().GetNumberOfCells() == 3
+post_event(url, "/selection", {"edges": [1, 7]})
+assert edges_actor.GetMapper().GetInput().GetNumberOfCells() == 2, "Out of range indices should be ignored"
+
+# Test 5: Malformed requests are answered with 400 and leave the server running
+import urllib.error
+def status_of(request):
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+def post(path, body):
+    return urllib.request.Request(f"{url}{path}", data=body.encode(),
+                                  headers={"Content-Type": "application/json"}, method="POST")
+
+assert status_of(f"{url}/frame?quality=abc") == 400
+assert status_of(f"{url}/frame?quality=0") == 400
+assert status_of(f"{url}/frame?format=gif") == 400
+assert status_of(post("/selection", "[1, 2]")) == 400
+assert status_of(post("/selection", '{"markers": [1]}')) == 400
+assert status_of(post("/selection", '{"edges": ["x"]}')) == 400
+assert status_of(post("/camera?client=a", '{"position": "abc"}')) == 400
+assert status_of(post("/camera", "not json")) == 400
+assert post_event(url, "/camera", {}, client="a") == camera_a, "A rejected event changed the client camera"
+assert request_frame(url)[0][:2] == b"\xff\xd8"
+
+# Test 6: Concurrent stand-in clients get all their frames and latencies are reported
+reports = {}
+def client(name):
+    reports[name] = run_stand_in_client(url, client=name, n_frames=5)
+threads = [threading.Thread(target=client, args=(f"c{i}",)) for i in range(3)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert all(report["frames"] == 5 and report["round_trip"]["mean_ms"] > 0 for report in reports.values())
+
+with urllib.request.urlopen(f"{url}/stats") as response:
+    stats = json.loads(response.read())
+assert stats["frames"] == 5 + 3 * 5, f"Expected 20 rendered frames, found {stats['frames']}"
+assert stats["encode"]["mean_ms"] > 0
+
+server.shutdown()
+server.server_close()
@@ -0,0 +1,86 @@
+import vtk
+import sys
+import os
+import csv
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.render_stats import collect_scene_statistics, record_orbit, format_statistics
+
+# Build a small scene with a known number of points and cells
+sphere = vtk.vtkSphereSource()
+sphere.Update()
+mapper = vtk.vtkPolyDataMapper()
+mapper.SetInputData(sphere.GetOutput())
+actor = vtk.vtkActor()
+actor.SetMapper(mapper)
+
+hidden = vtk.vtkActor()
+hidden.SetMapper(mapper)
+hidden.VisibilityOff()
+
+renderer = vtk.vtkRenderer()
+renderer.AddActor(actor)
+renderer.AddActor(hidden)
+render_window = vtk.vtkRenderWindow()
+render_window.SetOffScreenRendering(1)
+render_window.AddRenderer(renderer)
+
+# Test 1: Only visible actors are counted
+stats = collect_scene_statistics(renderer)
+assert stats["actors"] == 1, f"Expected 1 visible actor, found {stats['actors']}"
+assert stats["points"] == sphere.GetOutput().GetNumberOfPoints()
+assert stats["cells"] == sphere.GetOutput().GetNumberOfCells()
+assert stats["max_cells"] == stats["cells"]
+
+# Test 2: Overlay text contains every statistic
+text = format_statistics(60.0, 0.01, stats)
+for field in ["FPS", "Last render", "Actors", "Points", "Cells"]:
+    assert field in text, f"Overlay text does not contain '{field}'"
+
+# Test 3: Orbit writes one CSV row per frame
+with tempfile.TemporaryDirectory() as tmp:
+    csv_path = os.path.join(tmp, "orbit.csv")
+    rows = record_orbit(render_window, renderer, csv_path, n_frames=5, step=72.0)
+    assert len(rows) == 5
+    with open(csv_path, newline="") as f:
+        logged = list(csv.DictReader(f))
+    assert len(logged) == 5, f"Expected 5 logged frames, found {len(logged)}"
+    assert all(float(row["wall_time_s"]) >= 0 for row in logged)
+
+# ----------------------------------------------------------------------------------------------------------------------------
+import time
+from src.visualization import create_renderer, create_render_window, create_interactor
+from src.render_stats import attach_stats_overlay
+
+# The interactor is attached before the window is first rendered
+renderer = create_renderer()
+renderer.AddActor(actor)
+render_window = create_render_window(renderer)
+render_window.SetOffScreenRendering(1)
+interactor = create_interactor(render_window)
+render_window.Render()
+overlay = attach_stats_overlay(interactor, renderer)
+seen_at_start = []
+renderer.AddObserver("StartEvent", lambda obj, event: seen_at_start.append(overlay.GetInput()))
+
+# Test 4: The frame rendered when the overlay is toggled on already shows the statistics
+interactor.SetKeySym("i")
+interactor.InvokeEvent("KeyPressEvent")
+assert overlay.GetVisibility()
+assert seen_at_start[-1] is not None and "Cells" in seen_at_start[-1], "Overlay is empty on the toggle frame"
+
+# Test 5: Idle time between renders does not lower the FPS
+time.sleep(1.0)
+render_window.Render()
+render_window.Render()
+fps = float(overlay.GetInput().split("\n")[0].split(":")[1])
+assert fps > 2.0, f"FPS ({fps}) includes the idle time between renders"
+
+# Test 6: Counts follow visibility changes made while the overlay is shown
+actor.VisibilityOff()
+render_window.Render()
+assert "Actors: 0" in overlay.GetInput(), "Overlay counts were not refreshed"
+actor.VisibilityOn()
+render_window.Render()
+assert "Actors: 1" in overlay.GetInput()
@@ -25,4 +25,24 @@ interactor = create_interactor(render_window)
 assert isinstance(interactor, vtk.vtkRenderWindowInteractor)
 assert interactor.GetRenderWindow() is render_window
 style = interactor.GetInteractorStyle()
-assert isinstance(style, vtk.vtkInteractorStyleTrackballCamera)
\ No newline at end of file
+assert isinstance(style, vtk.vtkInteractorStyleTrackballCamera)
+
+# Test to configure the transparency strategy
+from src.visualization import configure_transparency, TRANSPARENCY_MODES
+multisamples, alpha_bit_planes = render_window.GetMultiSamples(), render_window.GetAlphaBitPlanes()
+configure_transparency(renderer, render_window, "depth_peeling", max_peels=3)
+assert renderer.GetUseDepthPeeling() and not renderer.GetUseOIT()
+assert renderer.GetMaximumNumberOfPeels() == 3
+assert render_window.GetMultiSamples() == 0
+configure_transparency(renderer, render_window, "oit")
+assert renderer.GetUseOIT() and not renderer.GetUseDepthPeeling()
+assert render_window.GetMultiSamples() == multisamples and render_window.GetAlphaBitPlanes() == alpha_bit_planes, \
+    "Leaving depth peeling should restore the window settings"
+configure_transparency(renderer, render_window, "opaque")
+assert not renderer.GetUseOIT() and not renderer.GetUseDepthPeeling()
+try:
+    configure_transparency(renderer, render_window, "sorted")
+    assert False, "An unknown transparency mode should raise ValueError"
+except ValueError:
+    pass
+assert "opaque" in TRANSPARENCY_MODES